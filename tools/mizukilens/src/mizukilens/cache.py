@@ -10,8 +10,11 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 # ---------------------------------------------------------------------------
 # Status enum values (§3.1.7)
@@ -135,6 +138,11 @@ VALID_CANDIDATE_STATUSES: tuple[str, ...] = ("pending", "approved", "rejected")
 _CREATE_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_streams_status ON streams(status);",
     "CREATE INDEX IF NOT EXISTS idx_parsed_songs_video_id ON parsed_songs(video_id);",
+    "CREATE INDEX IF NOT EXISTS idx_parsed_songs_video_order ON parsed_songs(video_id, order_index);",
+    # Partial index over songs still missing an end timestamp: serves the
+    # stamp UI's per-stream pending counts and get_songs_missing_end_timestamp.
+    "CREATE INDEX IF NOT EXISTS idx_parsed_songs_pending_end ON parsed_songs(video_id, order_index) "
+    "WHERE end_timestamp IS NULL;",
     "CREATE INDEX IF NOT EXISTS idx_candidate_comments_video_id ON candidate_comments(video_id);",
 ]
 
@@ -148,12 +156,18 @@ def get_db_path(path: str | Path | None = None) -> Path:
     return _resolve_cache_path(path)
 
 
-def open_db(path: str | Path | None = None) -> sqlite3.Connection:
+def open_db(
+    path: str | Path | None = None,
+    *,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
     """Open (and initialise) the SQLite database, creating directories as needed.
 
     Args:
         path: Override the database path.  Defaults to the config-specified path
               or ``~/.local/share/mizukilens/cache.db``.
+        check_same_thread: Passed to :func:`sqlite3.connect`; set to False when
+              the connection is handed between threads (one at a time).
 
     Returns:
         An open :class:`sqlite3.Connection` with foreign-key support enabled.
@@ -163,10 +177,14 @@ def open_db(path: str | Path | None = None) -> sqlite3.Connection:
     db_path = _resolve_cache_path(path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
     conn.execute("PRAGMA journal_mode = WAL;")
+    # In WAL mode NORMAL only syncs at checkpoints, not on every commit.
+    # The cache helpers commit per call, so this keeps batch runs such as
+    # extract_all_discovered from paying an fsync per statement.
+    conn.execute("PRAGMA synchronous = NORMAL;")
     _init_schema(conn)
     return conn
 
@@ -351,6 +369,66 @@ def update_stream_status(
     conn.commit()
 
 
+def mark_streams_imported(
+    conn: sqlite3.Connection,
+    video_ids: Iterable[str],
+) -> int:
+    """Move every ``exported`` or ``approved`` stream in *video_ids* to ``imported``.
+
+    Equivalent to :func:`update_stream_status` to ``imported`` per stream
+    (going through ``exported`` for approved streams), but issued as one
+    batched statement and a single commit.  Streams that are missing or in
+    any other status are left untouched.
+
+    Returns:
+        Number of streams updated.
+    """
+    now = _now_iso()
+    cur = conn.executemany(
+        "UPDATE streams SET status = 'imported', updated_at = ? "
+        "WHERE video_id = ? AND status IN ('exported', 'approved')",
+        ((now, video_id) for video_id in video_ids),
+    )
+    conn.commit()
+    return cur.rowcount
+
+
+def update_streams_status(
+    conn: sqlite3.Connection,
+    video_ids: Iterable[str],
+    new_status: str,
+) -> int:
+    """Move every stream in *video_ids* to *new_status* in one batch.
+
+    Equivalent to :func:`update_stream_status` per stream, but issued as one
+    batched statement and a single commit.  Streams that are missing or
+    whose current status cannot transition to *new_status* are left
+    untouched instead of raising.
+
+    Raises:
+        ValueError: If *new_status* is not a valid status.
+
+    Returns:
+        Number of streams updated.
+    """
+    if new_status not in VALID_STATUSES:
+        raise ValueError(f"Invalid status {new_status!r}.")
+    sources = sorted(
+        status for status, allowed in VALID_TRANSITIONS.items()
+        if status is not None and new_status in allowed
+    )
+    if not sources:
+        return 0
+    now = _now_iso()
+    cur = conn.executemany(
+        "UPDATE streams SET status = ?, updated_at = ? "
+        f"WHERE video_id = ? AND status IN ({','.join('?' * len(sources))})",
+        ((new_status, now, video_id, *sources) for video_id in video_ids),
+    )
+    conn.commit()
+    return cur.rowcount
+
+
 def update_stream_date(
     conn: sqlite3.Connection,
     video_id: str,
@@ -424,6 +502,59 @@ def get_status_counts(conn: sqlite3.Connection) -> dict[str, int]:
     return counts
 
 
+@lru_cache(maxsize=1)
+def _artist_trim_chars() -> str:
+    """Return every ``str.isspace()`` code point, for SQL ``trim()``.
+
+    Stripping this set makes ``trim()`` agree with ``str.strip()`` when
+    deciding whether an artist counts as present (NBSP and ideographic
+    spaces are common in scraped setlists).  Built on first use: scanning
+    all code points takes tens of milliseconds, too much for import time.
+    """
+    return "".join(c for c in map(chr, range(0x110000)) if c.isspace())
+
+
+def get_report_aggregates(
+    conn: sqlite3.Connection,
+    status: str = "extracted",
+) -> list[sqlite3.Row]:
+    """Return per-stream song statistics for every stream with *status*.
+
+    Each row carries ``video_id``, ``title``, ``date``, ``song_count`` and
+    ``artist_count`` (songs whose artist is non-blank), ordered like
+    :func:`list_streams`.  Computed with a single grouped join so reports do
+    not issue one query per stream.
+    """
+    cur = conn.execute(
+        """
+        SELECT s.video_id, s.title, s.date,
+               COUNT(p.id) AS song_count,
+               COUNT(NULLIF(TRIM(p.artist, ?), '')) AS artist_count
+        FROM streams s
+        LEFT JOIN parsed_songs p ON p.video_id = s.video_id
+        WHERE s.status = ?
+        GROUP BY s.video_id
+        ORDER BY s.date DESC, s.video_id
+        """,
+        (_artist_trim_chars(), status),
+    )
+    return cur.fetchall()
+
+
+def list_song_artists(
+    conn: sqlite3.Connection,
+    status: str = "extracted",
+) -> list[str]:
+    """Return the non-null artist of every parsed song in streams with *status*."""
+    cur = conn.execute(
+        "SELECT p.artist FROM parsed_songs p "
+        "JOIN streams s ON s.video_id = p.video_id "
+        "WHERE s.status = ? AND p.artist IS NOT NULL",
+        (status,),
+    )
+    return [row[0] for row in cur.fetchall()]
+
+
 # ---------------------------------------------------------------------------
 # Parsed songs CRUD
 # ---------------------------------------------------------------------------
@@ -531,6 +662,76 @@ def get_parsed_songs(
     return cur.fetchall()
 
 
+# Stay well below SQLite's historical SQLITE_MAX_VARIABLE_NUMBER of 999.
+_IN_CHUNK_SIZE = 500
+
+
+def _query_in_chunks(
+    conn: sqlite3.Connection,
+    sql_template: str,
+    ids: list[str],
+    *,
+    chunk_size: int = _IN_CHUNK_SIZE,
+) -> Iterator[sqlite3.Row]:
+    """Yield rows for an ``IN (...)`` query over *ids*, one chunk at a time.
+
+    *sql_template* must contain a single ``{placeholders}`` field, which is
+    replaced with the right number of ``?`` markers for each chunk.
+    """
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        placeholders = ",".join("?" * len(chunk))
+        yield from conn.execute(sql_template.format(placeholders=placeholders), chunk)
+
+
+def get_parsed_songs_for_streams(
+    conn: sqlite3.Connection,
+    video_ids: list[str],
+) -> dict[str, list[sqlite3.Row]]:
+    """Return parsed songs for every stream in *video_ids* in batched queries.
+
+    SQLite sorts the rows by ``(video_id, order_index)`` so they can be
+    grouped in a single linear pass.  Streams without songs map to an empty
+    list; the returned dict preserves the order of *video_ids*.
+    """
+    grouped: dict[str, list[sqlite3.Row]] = {vid: [] for vid in video_ids}
+    rows = _query_in_chunks(
+        conn,
+        "SELECT * FROM parsed_songs WHERE video_id IN ({placeholders}) "
+        "ORDER BY video_id, order_index",
+        list(grouped),
+    )
+    for video_id, group in groupby(rows, key=itemgetter("video_id")):
+        grouped[video_id] = list(group)
+    return grouped
+
+
+def find_parsed_songs_glob(
+    conn: sqlite3.Connection,
+    patterns: Iterable[str],
+) -> list[sqlite3.Row]:
+    """Return parsed songs whose ``song_name`` or ``artist`` matches a GLOB.
+
+    A row is returned when either field matches any of *patterns*.  Rows are
+    ordered like :func:`list_streams` and then by ``order_index``, so callers
+    see the same order as walking every stream's songs.
+    """
+    clauses = []
+    params: list[str] = []
+    for pattern in patterns:
+        clauses.append("p.song_name GLOB ? OR p.artist GLOB ?")
+        params += [pattern, pattern]
+    if not clauses:
+        return []
+    cur = conn.execute(
+        "SELECT p.* FROM parsed_songs p JOIN streams s ON s.video_id = p.video_id "
+        f"WHERE {' OR '.join(clauses)} "
+        "ORDER BY s.date DESC, s.video_id, p.order_index",
+        params,
+    )
+    return cur.fetchall()
+
+
 def get_songs_missing_end_timestamp(conn: sqlite3.Connection) -> list[sqlite3.Row]:
     """Return all parsed_songs rows where end_timestamp IS NULL."""
     cur = conn.execute(
@@ -539,6 +740,27 @@ def get_songs_missing_end_timestamp(conn: sqlite3.Connection) -> list[sqlite3.Ro
     return cur.fetchall()
 
 
+def update_song_texts(
+    conn: sqlite3.Connection,
+    updates: Iterable[tuple[int, str, str | None]],
+) -> int:
+    """Set ``song_name`` and ``artist`` on parsed_songs rows (by PK id).
+
+    *updates* yields ``(song_id, song_name, artist)`` tuples.  Only the
+    listed rows are written, so other columns (manual end timestamps,
+    durations) are left as they are.  All updates share a single commit.
+
+    Returns:
+        Number of rows updated.
+    """
+    cur = conn.executemany(
+        "UPDATE parsed_songs SET song_name = ?, artist = ? WHERE id = ?",
+        ((song_name, artist, song_id) for song_id, song_name, artist in updates),
+    )
+    conn.commit()
+    return cur.rowcount
+
+
 def update_song_end_timestamp(
     conn: sqlite3.Connection,
     song_id: int,
@@ -771,7 +993,7 @@ def save_candidate_comments(
     existing_cids: set[str | None] = {row["comment_cid"] for row in cur.fetchall()}
 
     now = _now_iso()
-    inserted = 0
+    rows: list[dict[str, Any]] = []
     for c in candidates:
         cid = c.get("comment_cid")
         # Skip if this cid is already stored (dedup)
@@ -779,15 +1001,7 @@ def save_candidate_comments(
             continue
         keywords = c.get("keywords_matched", [])
         keywords_str = ",".join(keywords) if keywords else None
-        conn.execute(
-            """
-            INSERT INTO candidate_comments
-                (video_id, comment_cid, comment_author, comment_author_url,
-                 comment_text, keywords_matched, status, created_at, updated_at)
-            VALUES
-                (:video_id, :comment_cid, :comment_author, :comment_author_url,
-                 :comment_text, :keywords_matched, 'pending', :now, :now)
-            """,
+        rows.append(
             {
                 "video_id":           video_id,
                 "comment_cid":        cid,
@@ -796,11 +1010,24 @@ def save_candidate_comments(
                 "comment_text":       c["comment_text"],
                 "keywords_matched":   keywords_str,
                 "now":                now,
-            },
+            }
         )
         if cid is not None:
             existing_cids.add(cid)
-        inserted += 1
+
+    # One prepared statement for the whole batch
+    conn.executemany(
+        """
+        INSERT INTO candidate_comments
+            (video_id, comment_cid, comment_author, comment_author_url,
+             comment_text, keywords_matched, status, created_at, updated_at)
+        VALUES
+            (:video_id, :comment_cid, :comment_author, :comment_author_url,
+             :comment_text, :keywords_matched, 'pending', :now, :now)
+        """,
+        rows,
+    )
+    inserted = len(rows)
 
     conn.commit()
     return inserted
@@ -359,7 +359,8 @@ def fill_artists_cmd(dry_run: bool, yes: bool, include_ambiguous: bool) -> None:
     # --- Backup & write -----------------------------------------------------
     shutil.copy2(songs_path, songs_path.with_suffix(".json.bak"))
 
-    count = apply_fill_plan(songs, candidates)
+    song_by_id = {s["id"]: s for s in songs}
+    count = apply_fill_plan(songs, candidates, song_by_id)
 
     with songs_path.open("w", encoding="utf-8") as fh:
         json.dump(songs, fh, ensure_ascii=False, indent=2)
@@ -1487,9 +1488,11 @@ def metadata_fetch_cmd(
     from rich import box
     from mizukilens.metadata import (
         read_metadata_file,
-        fetch_song_metadata,
-        is_stale,
-        STALE_DAYS,
+        FETCH_CHECKPOINT_EVERY,
+        RecordStore,
+        fetch_song_metadata_into,
+        plan_fetches,
+        write_fetch_records,
     )
 
     # Locate MizukiPrism root
@@ -1518,8 +1521,7 @@ def metadata_fetch_cmd(
 
     # Load existing metadata records for filtering
     metadata_path = metadata_dir / "song-metadata.json"
-    existing_metadata: list[dict] = read_metadata_file(metadata_path)
-    existing_by_id: dict[str, dict] = {r["songId"]: r for r in existing_metadata if "songId" in r}
+    metadata_store = RecordStore.from_records(read_metadata_file(metadata_path), "songId")
 
     # Determine target songs
     if song_id is not None:
@@ -1528,24 +1530,8 @@ def metadata_fetch_cmd(
         if not target_songs:
             console.print(f"[red]Error:[/red] Song ID [bold]{song_id}[/bold] not found in songs.json.")
             sys.exit(1)
-    elif mode == "missing":
-        target_songs = [s for s in all_songs if s.get("id") not in existing_by_id]
-    elif mode == "stale":
-        target_songs = [
-            s for s in all_songs
-            if s.get("id") in existing_by_id and is_stale(existing_by_id[s["id"]])
-        ]
-    elif mode == "all":
-        if force:
-            target_songs = list(all_songs)
-        else:
-            # Skip manual entries unless --force
-            target_songs = [
-                s for s in all_songs
-                if existing_by_id.get(s.get("id", ""), {}).get("fetchStatus") != "manual"
-            ]
     else:
-        target_songs = []
+        target_songs = plan_fetches(all_songs, metadata_store.by_key, mode, force=force)
 
     if not target_songs:
         console.print("[dim]No songs to fetch. Nothing to do.[/dim]")
@@ -1553,6 +1539,12 @@ def metadata_fetch_cmd(
 
     console.print(f"[cyan]Fetching metadata for[/cyan] [bold]{len(target_songs)}[/bold] songs...")
 
+    # Fetch into in-memory records; the files are written back every
+    # FETCH_CHECKPOINT_EVERY songs and once at the end, not per song.
+    artist_store = RecordStore.from_records(
+        read_metadata_file(metadata_dir / "artist-info.json"), "normalizedArtist",
+    )
+
     # --- Fetch with progress bar ---
     matched = 0
     no_match = 0
@@ -1569,37 +1561,43 @@ def metadata_fetch_cmd(
     ) as progress:
         task = progress.add_task("Fetching...", total=len(target_songs))
 
-        for i, song in enumerate(target_songs):
-            title = song.get("title", "")
-            artist = song.get("originalArtist", "")
-            progress.update(
-                task,
-                advance=0,
-                description=f"[{i + 1}/{len(target_songs)}] {artist} — {title}",
-            )
-
-            try:
-                result = fetch_song_metadata(
-                    song=song,
-                    metadata_dir=metadata_dir,
+        try:
+            for i, song in enumerate(target_songs):
+                title = song.get("title", "")
+                artist = song.get("originalArtist", "")
+                progress.update(
+                    task,
+                    advance=0,
+                    description=f"[{i + 1}/{len(target_songs)}] {artist} — {title}",
                 )
-            except Exception as exc:  # noqa: BLE001
-                console.print(f"\n[red]Unexpected error[/red] for song {song.get('id')}: {exc}")
-                errored += 1
-                progress.advance(task)
-                continue
-
-            status = result.overall_status
-            if status == "matched":
-                matched += 1
-            elif status == "no_match":
-                no_match += 1
-            elif status == "error":
-                errored += 1
-            elif status == "skipped":
-                skipped_count += 1
+                if i and i % FETCH_CHECKPOINT_EVERY == 0:
+                    write_fetch_records(metadata_dir, metadata_store, artist_store)
+
+                try:
+                    result = fetch_song_metadata_into(
+                        song=song,
+                        metadata=metadata_store,
+                        artists=artist_store,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    console.print(f"\n[red]Unexpected error[/red] for song {song.get('id')}: {exc}")
+                    errored += 1
+                    progress.advance(task)
+                    continue
+
+                status = result.overall_status
+                if status == "matched":
+                    matched += 1
+                elif status == "no_match":
+                    no_match += 1
+                elif status == "error":
+                    errored += 1
+                elif status == "skipped":
+                    skipped_count += 1
 
-            progress.advance(task)
+                progress.advance(task)
+        finally:
+            write_fetch_records(metadata_dir, metadata_store, artist_store)
 
     console.print()
 
@@ -1665,13 +1663,14 @@ def metadata_status_cmd(detail: bool, filter_status: str | None) -> None:
     songs_path = prism_root / "data" / "songs.json"
     metadata_dir = prism_root / "data" / "metadata"
 
-    records = get_metadata_status(songs_path, metadata_dir)
+    all_records = get_metadata_status(songs_path, metadata_dir)
 
-    if not records:
+    if not all_records:
         console.print("[dim]No songs found in songs.json.[/dim]")
         return
 
     # Apply filter
+    records = all_records
     if filter_status is not None:
         records = [
             r for r in records
@@ -1731,7 +1730,6 @@ def metadata_status_cmd(detail: bool, filter_status: str | None) -> None:
     console.print(tbl)
 
     # --- Compute summary counts (over all records, before filter) ---
-    all_records = get_metadata_status(songs_path, metadata_dir)
     status_counts: dict[str, int] = {
         "matched": 0,
         "no_match": 0,
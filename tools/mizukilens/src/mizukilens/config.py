@@ -28,6 +28,7 @@ DEFAULT_SONGLIST_KEYWORDS: list[str] = [
 ]
 DEFAULT_CACHE_PATH = "~/.local/share/mizukilens/cache.db"
 DEFAULT_EXPORT_DIR = "~/.local/share/mizukilens/exports"
+DEFAULT_EXPORT_FETCH_BATCH = 1000
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +125,20 @@ def get_songlist_keywords() -> list[str]:
     return list(DEFAULT_SONGLIST_KEYWORDS)
 
 
+def get_export_fetch_batch() -> int:
+    """Return the cursor ``arraysize`` used for export queries.
+
+    Checks ``[export] fetch_batch`` in the config file, falling back to
+    :data:`DEFAULT_EXPORT_FETCH_BATCH` when unset or not a positive integer.
+    """
+    cfg = load_config()
+    if cfg:
+        batch = cfg.get("export", {}).get("fetch_batch")
+        if isinstance(batch, int) and not isinstance(batch, bool) and batch > 0:
+            return batch
+    return DEFAULT_EXPORT_FETCH_BATCH
+
+
 def load_config() -> dict[str, Any] | None:
     """Load config from disk.  Returns None if the file does not exist."""
     if not CONFIG_PATH.exists():
@@ -7,6 +7,10 @@ Public API
 ----------
 export_approved_streams(conn, *, since, stream_id, output_dir, channel_id)
     Build and write the export JSON, returning an ExportResult.
+build_export_payload(conn, *, streams, channel_id, now)
+    Build the export document in memory as a dict.
+write_export_streaming(conn, output_path, *, video_ids, channel_id, now)
+    Write the export document to disk incrementally.
 """
 
 from __future__ import annotations
@@ -16,8 +20,11 @@ import sqlite3
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
+
+import orjson
 
 
 # ---------------------------------------------------------------------------
@@ -63,25 +70,54 @@ def _resolve_output_dir(output_dir: str | Path | None) -> Path:
     """
     if output_dir is not None:
         return Path(output_dir).expanduser().resolve()
+    return _default_output_dir()
+
+
+@lru_cache(maxsize=1)
+def _default_output_dir() -> Path:
+    """Return the configured (or default) export directory.
+
+    The config file is read once per process; batch exports in a loop reuse
+    the resolved path.
+    """
+    from mizukilens.config import DEFAULT_EXPORT_DIR, load_config  # local import
 
-    # Try loading from config
     try:
-        from mizukilens.config import load_config, DEFAULT_EXPORT_DIR  # local import
         cfg = load_config()
         if cfg:
             raw = cfg.get("export", {}).get("output_dir")
             if raw:
                 return Path(raw).expanduser().resolve()
-        return Path(DEFAULT_EXPORT_DIR).expanduser().resolve()
     except Exception:  # noqa: BLE001
-        from mizukilens.config import DEFAULT_EXPORT_DIR
-        return Path(DEFAULT_EXPORT_DIR).expanduser().resolve()
+        pass
+    return Path(DEFAULT_EXPORT_DIR).expanduser().resolve()
+
+
+@lru_cache(maxsize=1)
+def _fetch_batch() -> int:
+    """Return the cursor ``arraysize`` for export queries, read once per process."""
+    from mizukilens.config import DEFAULT_EXPORT_FETCH_BATCH, get_export_fetch_batch  # local import
+
+    try:
+        return get_export_fetch_batch()
+    except Exception:  # noqa: BLE001
+        return DEFAULT_EXPORT_FETCH_BATCH
+
+
+def _iso_seconds(now: datetime) -> str:
+    """Return *now* as ``YYYY-MM-DDTHH:MM:SS`` without any UTC offset.
+
+    ``isoformat`` avoids the locale-aware ``strftime`` path used previously.
+    """
+    return now.replace(tzinfo=None).isoformat(timespec="seconds")
 
 
 def _export_filename(now: datetime) -> str:
     """Return a filename like ``mizukilens-export-2024-03-15-143000.json``."""
-    ts = now.strftime("%Y-%m-%d-%H%M%S")
-    return f"mizukilens-export-{ts}.json"
+    return (
+        f"mizukilens-export-{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        f"-{now.hour:02d}{now.minute:02d}{now.second:02d}.json"
+    )
 
 
 def _load_approved_streams(
@@ -123,72 +159,87 @@ def _load_approved_streams(
     return cur.fetchall()
 
 
-# ---------------------------------------------------------------------------
-# Core export builder
-# ---------------------------------------------------------------------------
+# Builds each Stream entity inside SQLite with the JSON1 functions, preserving
+# the order of the video IDs passed in (bound as a JSON array and walked with
+# json_each).  Empty strings are treated like NULL, matching the truthiness
+# checks of the contract.
+_STREAM_ENTITY_ROWS_SQL = """
+SELECT json_patch(
+    json_object(
+        'id', s.video_id,
+        'youtubeUrl', 'https://www.youtube.com/watch?v=' || s.video_id,
+        'date', COALESCE(s.date, ''),
+        'title', COALESCE(s.title, '')
+    ),
+    CASE WHEN NULLIF(s.comment_author, '') IS NULL THEN '{}'
+    ELSE json_object('commentCredit', json_patch(
+        json_object('author', s.comment_author),
+        json_patch(
+            CASE WHEN NULLIF(s.comment_author_url, '') IS NULL THEN '{}'
+            ELSE json_object('authorUrl', s.comment_author_url) END,
+            CASE WHEN NULLIF(s.comment_id, '') IS NULL THEN '{}'
+            ELSE json_object(
+                'commentUrl',
+                'https://www.youtube.com/watch?v=' || s.video_id || '&lc=' || s.comment_id
+            ) END
+        )
+    )) END
+) AS entity
+FROM json_each(?) AS ids
+JOIN streams AS s ON s.video_id = ids.value
+ORDER BY ids.key
+"""
 
-def build_export_payload(
-    conn: sqlite3.Connection,
-    *,
-    streams: list[sqlite3.Row],
-    channel_id: str,
-    now: datetime | None = None,
-) -> dict[str, Any]:
-    """Build the top-level export JSON dict from the provided stream rows.
+# Aggregates the rows above into a single JSON array document.
+_STREAM_ENTITIES_SQL = f"SELECT json_group_array(json(entity)) FROM ({_STREAM_ENTITY_ROWS_SQL})"
 
-    Song deduplication is performed here: streams that share the same
-    ``(name, artist)`` pair are merged into a single Song entity with
-    multiple Version entries.
 
-    Args:
-        conn: Open SQLite connection (used to fetch parsed_songs rows).
-        streams: Pre-fetched stream rows (must all have status ``"approved"``).
-        channel_id: YouTube channel ID written to the top-level ``channelId``.
-        now: Export timestamp; defaults to current UTC time.
+def _build_stream_entities(
+    conn: sqlite3.Connection,
+    video_ids: list[str],
+) -> list[dict[str, Any]]:
+    """Return the Stream entities for *video_ids*, built in SQL.
 
-    Returns:
-        A dict matching the MizukiPrism Data Contract §4.3.1.
+    SQLite assembles the whole ``streams`` array as one JSON document, so
+    Python only decodes a single string instead of reading each column of
+    each row and building the dicts itself.
     """
-    from mizukilens.cache import get_parsed_songs  # local import to avoid cycles
+    (raw,) = conn.execute(_STREAM_ENTITIES_SQL, (json.dumps(video_ids),)).fetchone()
+    return json.loads(raw)
 
-    if now is None:
-        now = datetime.now(tz=timezone.utc)
-
-    # exported_at in ISO 8601 with "Z" suffix (UTC)
-    exported_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    stream_entities: list[dict[str, Any]] = []
-    song_map: dict[tuple[str, str], dict[str, Any]] = {}  # (name, artist) → song entity
-    version_entities: list[dict[str, Any]] = []
+def _iter_stream_entity_json(
+    conn: sqlite3.Connection,
+    video_ids: list[str],
+) -> Iterator[str]:
+    """Yield each Stream entity for *video_ids* as a JSON text fragment."""
+    cur = conn.cursor()
+    # fetchmany() reads arraysize for its batch size (fetchall() ignores it).
+    cur.arraysize = _fetch_batch()
+    cur.execute(_STREAM_ENTITY_ROWS_SQL, (json.dumps(video_ids),))
+    while rows := cur.fetchmany():
+        for (entity,) in rows:
+            yield entity
+
+
+def _iter_version_entities(
+    conn: sqlite3.Connection,
+    video_ids: list[str],
+    song_map: dict[tuple[str, str], dict[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    """Yield Version entities for *video_ids*, registering songs as they appear.
+
+    Song deduplication happens here: each new ``(name, artist)`` pair is added
+    to *song_map* with a fresh Song ID before the first version referencing
+    it is yielded, so the map is complete once the generator is exhausted.
+    """
+    from mizukilens.cache import get_parsed_songs_for_streams  # local import to avoid cycles
 
-    for stream_row in streams:
-        video_id: str = stream_row["video_id"]
-        title: str = stream_row["title"] or ""
-        date: str = stream_row["date"] or ""
-
-        stream_entity: dict[str, Any] = {
-            "id": video_id,
-            "youtubeUrl": _youtube_url(video_id),
-            "date": date,
-            "title": title,
-        }
+    # One sorted query for all streams instead of one query per stream.
+    songs_by_stream = get_parsed_songs_for_streams(conn, video_ids)
 
-        # Add comment credit when source is "comment" and author info is available
-        _comment_author = stream_row["comment_author"] if stream_row["comment_author"] else None
-        if _comment_author:
-            credit: dict[str, Any] = {"author": _comment_author}
-            _author_url = stream_row["comment_author_url"] if stream_row["comment_author_url"] else None
-            if _author_url:
-                credit["authorUrl"] = _author_url
-            _cid = stream_row["comment_id"] if stream_row["comment_id"] else None
-            if _cid:
-                credit["commentUrl"] = f"https://www.youtube.com/watch?v={video_id}&lc={_cid}"
-            stream_entity["commentCredit"] = credit
-
-        stream_entities.append(stream_entity)
-
-        songs_rows = get_parsed_songs(conn, video_id)
-        for song_row in songs_rows:
+    for video_id in video_ids:
+        for song_row in songs_by_stream[video_id]:
             name: str = song_row["song_name"] or ""
             artist: str = song_row["artist"] or ""
             start_ts: str = song_row["start_timestamp"] or ""
@@ -216,7 +267,45 @@ def build_export_payload(
             if note is not None:
                 ver["note"] = note
 
-            version_entities.append(ver)
+            yield ver
+
+
+# ---------------------------------------------------------------------------
+# Core export builder
+# ---------------------------------------------------------------------------
+
+def build_export_payload(
+    conn: sqlite3.Connection,
+    *,
+    streams: list[sqlite3.Row],
+    channel_id: str,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Build the top-level export JSON dict from the provided stream rows.
+
+    Song deduplication is performed here: streams that share the same
+    ``(name, artist)`` pair are merged into a single Song entity with
+    multiple Version entries.
+
+    Args:
+        conn: Open SQLite connection (used to fetch parsed_songs rows).
+        streams: Pre-fetched stream rows (must all have status ``"approved"``).
+        channel_id: YouTube channel ID written to the top-level ``channelId``.
+        now: Export timestamp; defaults to current UTC time.
+
+    Returns:
+        A dict matching the MizukiPrism Data Contract §4.3.1.
+    """
+    if now is None:
+        now = datetime.now(tz=timezone.utc)
+
+    # exported_at in ISO 8601 with "Z" suffix (UTC)
+    exported_at = _iso_seconds(now) + "Z"
+
+    video_ids = [row["video_id"] for row in streams]
+    stream_entities = _build_stream_entities(conn, video_ids)
+    song_map: dict[tuple[str, str], dict[str, Any]] = {}  # (name, artist) → song entity
+    version_entities = list(_iter_version_entities(conn, video_ids, song_map))
 
     return {
         "version": "1.0",
@@ -231,6 +320,70 @@ def build_export_payload(
     }
 
 
+def _write_array_items(fh: BinaryIO, items: Iterable[bytes]) -> int:
+    """Write pre-encoded JSON *items* as comma-separated array elements.
+
+    Returns the number of items written.
+    """
+    count = 0
+    for item in items:
+        fh.write(b",\n    " if count else b"\n    ")
+        fh.write(item)
+        count += 1
+    if count:
+        fh.write(b"\n  ")
+    return count
+
+
+def write_export_streaming(
+    conn: sqlite3.Connection,
+    output_path: Path,
+    *,
+    video_ids: list[str],
+    channel_id: str,
+    now: datetime,
+) -> tuple[int, int, int]:
+    """Write the export JSON for *video_ids* to *output_path* incrementally.
+
+    Produces the same document as :func:`build_export_payload` without ever
+    materialising it: stream entities are copied straight from SQLite and
+    each version is encoded with ``orjson`` as soon as it is built, one
+    compact entity per line.  Only the deduplicated song map is held in
+    memory, which is why ``data.songs`` is written after ``data.versions``
+    (key order within ``data`` carries no meaning).
+
+    Returns:
+        ``(stream_count, song_count, version_count)``.
+    """
+    header = orjson.dumps(
+        {
+            "version": "1.0",
+            "exportedAt": _iso_seconds(now) + "Z",
+            "source": "mizukilens",
+            "channelId": channel_id,
+        }
+    )
+    song_map: dict[tuple[str, str], dict[str, Any]] = {}
+
+    with output_path.open("wb") as fh:
+        fh.write(header[:-1] + b',"data":{\n  "streams": [')
+        stream_count = _write_array_items(
+            fh, (entity.encode("utf-8") for entity in _iter_stream_entity_json(conn, video_ids))
+        )
+        fh.write(b'],\n  "versions": [')
+        version_count = _write_array_items(
+            fh,
+            (orjson.dumps(ver) for ver in _iter_version_entities(conn, video_ids, song_map)),
+        )
+        fh.write(b'],\n  "songs": [')
+        song_count = _write_array_items(
+            fh, (orjson.dumps(song) for song in song_map.values())
+        )
+        fh.write(b"]\n}}\n")
+
+    return stream_count, song_count, version_count
+
+
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
@@ -270,15 +423,19 @@ def export_approved_streams(
         raise ValueError("no_approved_streams")
 
     now = datetime.now(tz=timezone.utc)
-    payload = build_export_payload(conn, streams=streams, channel_id=channel_id, now=now)
 
     out_dir = _resolve_output_dir(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     filename = _export_filename(now)
     output_path = out_dir / filename
 
-    with output_path.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, ensure_ascii=False, indent=2)
+    stream_count, song_count, version_count = write_export_streaming(
+        conn,
+        output_path,
+        video_ids=[row["video_id"] for row in streams],
+        channel_id=channel_id,
+        now=now,
+    )
 
     # Update each stream status to "exported" (skip if already exported)
     for stream_row in streams:
@@ -287,7 +444,7 @@ def export_approved_streams(
 
     return ExportResult(
         output_path=output_path,
-        stream_count=len(payload["data"]["streams"]),
-        song_count=len(payload["data"]["songs"]),
-        version_count=len(payload["data"]["versions"]),
+        stream_count=stream_count,
+        song_count=song_count,
+        version_count=version_count,
     )
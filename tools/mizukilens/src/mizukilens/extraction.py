@@ -20,8 +20,10 @@ from __future__ import annotations
 
 import re
 import sqlite3
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Generator
+from functools import lru_cache
+from typing import Any, Generator, Iterable
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -71,6 +73,9 @@ class ExtractionResult:
 # Group 1 = optional hours, Group 2 = minutes, Group 3 = seconds
 _TIMESTAMP_RE = re.compile(r"(?:(\d{1,2}):)?(\d{1,2}):(\d{2})")
 
+# Same pattern without capture groups, for counting only
+_TIMESTAMP_COUNT_RE = re.compile(r"(?:\d{1,2}:)?\d{1,2}:\d{2}")
+
 
 def parse_timestamp(ts: str) -> int | None:
     """Parse a timestamp string and return the total seconds.
@@ -100,7 +105,8 @@ def parse_timestamp(ts: str) -> int | None:
 
 def count_timestamps(text: str) -> int:
     """Return the number of timestamp-like patterns in *text*."""
-    return len(_TIMESTAMP_RE.findall(text))
+    # finditer avoids building findall's list of group tuples just to len() it
+    return sum(1 for _ in _TIMESTAMP_COUNT_RE.finditer(text))
 
 
 def is_suspicious_timestamp(seconds: int) -> bool:
@@ -112,28 +118,89 @@ def is_suspicious_timestamp(seconds: int) -> bool:
 # Song info parsing
 # ---------------------------------------------------------------------------
 
-# Separators between timestamp and song info (ordered: longest first to avoid
-# partial matches)
-_SEP_RE = re.compile(
-    r"^\s*"
-    r"(?:(?:\d{1,2}:)?\d{1,2}:\d{2})"  # timestamp (non-capturing)
-    r"\s*(?:\s+-\s+|\s+–\s+|\s+—\s+|\s+)"  # separator
-    r"(.+)$"
-)
-
 # Finds the timestamp at the start of a line
 _LINE_TS_RE = re.compile(r"^(?:(\d{1,2}):)?(\d{1,2}):(\d{2})")
 
-# Range end-timestamp: matches "~ HH:MM:SS", "- HH:MM:SS", etc.
-# Only matches when separator is immediately followed by a valid timestamp,
-# preventing false positives on "0:30 - Song Name".
-_RANGE_END_RE = re.compile(r"^(?:~|-|–|—)\s*(?:(\d{1,2}):)?(\d{1,2}):(\d{2})")
+# Everything between the leading timestamp and the song info, in one match
+# (used with ``.match(line, ts_end)``):
+#   1. optional range end-timestamp: "~ HH:MM:SS", "- HH:MM:SS", etc.  Only
+#      taken when the dash is immediately followed by a valid timestamp,
+#      preventing false positives on "0:30 - Song Name".
+#   2. optional separator: " - ", " – ", " — ".
+# Group 1 = optional end hours, group 2 = end minutes, group 3 = end seconds.
+_LINE_TAIL_RE = re.compile(
+    r"\s*(?:[~\-–—]\s*(?:(\d{1,2}):)?(\d{1,2}):(\d{2}))?"
+    r"\s*(?:[-–—]\s+)?"
+)
 
-# Separators for splitting artist from song name
-# Priority: " / " first (more specific), then " - " (but only when not used
-# as the timestamp-info separator itself)
-_ARTIST_SEP_RE = re.compile(r"\s*/\s+|\s+/\s+")  # space/slash variants
+# Separators for splitting artist from song name, tried in this order by
+# _split_artist: " / " variants, then " - ", then a bare "/"
+_ARTIST_SLASH_RE = re.compile(r"\s*/\s+|\s+/\s*")
 _ARTIST_DASH_RE = re.compile(r"\s+-\s+")
+_ARTIST_BARE_SLASH_RE = re.compile(r"/")
+
+# Leading line clean-up applied by parse_song_line before the timestamp, in a
+# single pass and in this order: box-drawing / tree characters (├ └ │ ─ etc.),
+# then at most one numbering prefix ("01. ", "1) ", "#3 "), then at most one
+# bullet ("- ", "* ", "+ ").
+_LEADING_JUNK_RE = re.compile(
+    r"^[\u2500-\u257F\s]*"
+    r"(?:\d+\.\s*|\d+\)\s+|#\d+\s+)?"
+    r"(?:[-*+]\s+)?"
+)
+
+
+def _ascii_digits(s: str, pos: int, limit: int) -> tuple[int, int]:
+    """Return ``(value, count)`` of up to *limit* ASCII digits at *s[pos]*."""
+    value = count = 0
+    for ch in s[pos : pos + limit]:
+        if not "0" <= ch <= "9":
+            break
+        value = value * 10 + ord(ch) - 48
+        count += 1
+    return value, count
+
+
+def _non_ascii_digit_at(s: str, pos: int) -> bool:
+    """Return True if *s[pos]* is a digit outside ASCII (e.g. full-width)."""
+    return pos < len(s) and s[pos].isdigit() and not "0" <= s[pos] <= "9"
+
+
+def _fast_leading_ts(line: str) -> tuple[int, int] | None:
+    """ASCII fast path for ``_LINE_TS_RE.match(line)``.
+
+    Walks the leading digits directly instead of running the regex.  Returns
+    ``(start_seconds, end_index)`` exactly as the regex would, or *None* when
+    the line does not start with an ASCII ``[H:]M:SS`` timestamp.  Any digit
+    group that stops on a non-ASCII digit also yields *None*, so the caller
+    falls back to the regex, which handles mixed and full-width digits.
+    """
+    n = len(line)
+
+    first, n_first = _ascii_digits(line, 0, 3)
+    if not 1 <= n_first <= 2 or n_first >= n or line[n_first] != ":":
+        return None
+
+    pos = n_first + 1
+    second, n_second = _ascii_digits(line, pos, 3)
+    if _non_ascii_digit_at(line, pos + n_second):
+        return None
+
+    # H:MM:SS — hours present when the second group is followed by ":SS"
+    if 1 <= n_second <= 2 and pos + n_second < n and line[pos + n_second] == ":":
+        third_pos = pos + n_second + 1
+        third, n_third = _ascii_digits(line, third_pos, 2)
+        if _non_ascii_digit_at(line, third_pos + n_third):
+            return None
+        if n_third == 2:
+            return first * 3600 + second * 60 + third, pos + n_second + 3
+
+    # M:SS — only the first two digits of the second group are seconds
+    if n_second >= 2:
+        seconds = (ord(line[pos]) - 48) * 10 + ord(line[pos + 1]) - 48
+        return first * 60 + seconds, pos + 2
+
+    return None
 
 
 def _split_artist(song_info: str) -> tuple[str, str]:
@@ -149,22 +216,26 @@ def _split_artist(song_info: str) -> tuple[str, str]:
     tuple[str, str]
         ``(song_name, artist)``
     """
+    # Every separator below needs a "/" or "-"; most titles have neither.
+    if "/" not in song_info and "-" not in song_info:
+        return song_info.strip(), ""
+
     # Try " / " variants
-    m = re.search(r"\s*/\s+|\s+/\s*", song_info)
+    m = _ARTIST_SLASH_RE.search(song_info)
     if m:
         name = song_info[: m.start()].strip()
         artist = song_info[m.end() :].strip()
         return name, artist
 
     # Try " - " (em-dash and en-dash handled as separators too)
-    m = re.search(r"\s+-\s+", song_info)
+    m = _ARTIST_DASH_RE.search(song_info)
     if m:
         name = song_info[: m.start()].strip()
         artist = song_info[m.end() :].strip()
         return name, artist
 
     # Try bare "/" (no spaces required) — common in JP/CN song listings
-    m = re.search(r"/", song_info)
+    m = _ARTIST_BARE_SLASH_RE.search(song_info)
     if m:
         name = song_info[: m.start()].strip()
         artist = song_info[m.end() :].strip()
@@ -198,47 +269,35 @@ def parse_song_line(line: str) -> dict[str, Any] | None:
     if not line:
         return None
 
-    # Strip leading box-drawing / tree-formatting characters (├ └ │ ─ etc.)
-    line = re.sub(r"^[\u2500-\u257F\s]+", "", line)
-    if not line:
-        return None
-
-    # Strip common numbering prefixes: "01. ", "1) ", "#3 "
-    line = re.sub(r"^(?:\d+\.\s*|\d+\)\s+|#\d+\s+)", "", line)
-
-    # Strip bullet prefixes: "- ", "* ", "+ "
-    line = re.sub(r"^[-*+]\s+", "", line)
+    # Strip leading tree characters, numbering and bullet prefixes in one pass
+    line = _LEADING_JUNK_RE.sub("", line, count=1)
 
-    # Find leading timestamp
-    ts_match = _LINE_TS_RE.match(line)
-    if not ts_match:
+    # Find leading timestamp (arithmetic fast path, regex fallback)
+    fast = _fast_leading_ts(line)
+    if fast is not None:
+        start_seconds, ts_end = fast
+    elif not line[:1].isdigit():
         return None
-
-    ts_end = ts_match.end()
-    hours = int(ts_match.group(1)) if ts_match.group(1) is not None else 0
-    minutes = int(ts_match.group(2))
-    seconds = int(ts_match.group(3))
-    start_seconds = hours * 3600 + minutes * 60 + seconds
-
-    # Rest of the line after the timestamp
-    remainder = line[ts_end:].strip()
-
-    # Check for range end-timestamp (e.g. "~ 00:08:26" or "- 1:23:45")
-    # Must be checked BEFORE separator stripping to avoid confusing
-    # "- 00:08:26 Song" (range) with "- Song Name" (separator)
+    else:
+        ts_match = _LINE_TS_RE.match(line)
+        if not ts_match:
+            return None
+
+        ts_end = ts_match.end()
+        hours = int(ts_match.group(1)) if ts_match.group(1) is not None else 0
+        minutes = int(ts_match.group(2))
+        seconds = int(ts_match.group(3))
+        start_seconds = hours * 3600 + minutes * 60 + seconds
+
+    # Range end-timestamp and separator after the timestamp, in one match.
+    # The range is tried BEFORE the separator to avoid confusing
+    # "- 00:08:26 Song" (range) with "- Song Name" (separator).
+    tail = _LINE_TAIL_RE.match(line, ts_end)
     end_seconds = None
-    range_match = _RANGE_END_RE.match(remainder)
-    if range_match:
-        rh = int(range_match.group(1)) if range_match.group(1) is not None else 0
-        rm = int(range_match.group(2))
-        rs = int(range_match.group(3))
-        end_seconds = rh * 3600 + rm * 60 + rs
-        remainder = remainder[range_match.end():].strip()
-
-    # Strip leading separator characters (" - ", " – ", " — ")
-    sep_match = re.match(r"^(?:-\s+|–\s+|—\s+|)", remainder)
-    if sep_match:
-        remainder = remainder[sep_match.end():].strip()
+    if tail.group(2) is not None:
+        rh = int(tail.group(1)) if tail.group(1) is not None else 0
+        end_seconds = rh * 3600 + int(tail.group(2)) * 60 + int(tail.group(3))
+    remainder = line[tail.end():].strip()
 
     if not remainder:
         return None
@@ -278,37 +337,40 @@ def parse_text_to_songs(text: str) -> list[dict[str, Any]]:
         ``start_timestamp``, ``end_timestamp``,
         ``suspicious``.
     """
-    raw_songs: list[dict[str, Any]] = []
+    # Collect parsed fields into parallel lists (one pass, no per-line dicts
+    # kept around) so end-time inference is plain indexed access.
+    starts: list[int] = []
+    explicit_ends: list[int | None] = []
+    names: list[str] = []
+    artists: list[str] = []
     for line in text.splitlines():
         parsed = parse_song_line(line)
         if parsed:
-            raw_songs.append(parsed)
+            starts.append(parsed["start_seconds"])
+            explicit_ends.append(parsed.get("end_seconds"))
+            names.append(parsed["song_name"])
+            artists.append(parsed["artist"])
 
-    if not raw_songs:
-        return []
+    count = len(starts)
 
     # Determine end timestamps: use explicit range end if available, else infer
     result: list[dict[str, Any]] = []
-    for i, song in enumerate(raw_songs):
-        start_sec = song["start_seconds"]
-        explicit_end = song.get("end_seconds")
-        if explicit_end is not None:
-            end_sec = explicit_end
-        elif i + 1 < len(raw_songs):
-            end_sec = raw_songs[i + 1]["start_seconds"]
-        else:
-            end_sec = None
+    for i in range(count):
+        start_sec = starts[i]
+        end_sec = explicit_ends[i]
+        if end_sec is None and i + 1 < count:
+            end_sec = starts[i + 1]
 
         result.append(
             {
                 "order_index": i,
-                "song_name": song["song_name"],
-                "artist": song["artist"],
+                "song_name": names[i],
+                "artist": artists[i],
                 "start_seconds": start_sec,
                 "end_seconds": end_sec,
                 "start_timestamp": seconds_to_timestamp(start_sec),
                 "end_timestamp": seconds_to_timestamp(end_sec) if end_sec is not None else None,
-                "suspicious": is_suspicious_timestamp(start_sec),
+                "suspicious": start_sec > SUSPICIOUS_THRESHOLD,  # is_suspicious_timestamp
             }
         )
 
@@ -334,6 +396,46 @@ def seconds_to_timestamp(seconds: int) -> str:
 # ---------------------------------------------------------------------------
 
 
+_KeywordPattern = tuple[re.Pattern[str], list[str]]
+
+
+@lru_cache(maxsize=8)
+def _keyword_patterns(
+    keywords: tuple[str, ...],
+) -> tuple[_KeywordPattern | None, _KeywordPattern | None]:
+    """Compile *keywords* into (ASCII, non-ASCII) alternation patterns.
+
+    ASCII keywords are lower-cased and matched against the lower-cased
+    comment text, as the ``kw.lower() in text.lower()`` check did (unlike
+    ``re.IGNORECASE``, which also folds e.g. "ſ" to "s"); non-ASCII keywords
+    are matched verbatim.  Each
+    keyword is its own capture group, so ``match.lastindex`` identifies it
+    (index ``i`` maps to ``keys[i - 1]``).  The alternation sits inside a
+    lookahead so a match is reported at every position — longer keywords are
+    listed first, so a keyword can only be shadowed by a longer keyword
+    starting at the same position, which the caller checks with
+    ``startswith``.
+    """
+    ascii_kws = sorted({kw.lower() for kw in keywords if kw.isascii()}, key=len, reverse=True)
+    other_kws = sorted({kw for kw in keywords if not kw.isascii()}, key=len, reverse=True)
+
+    def _compile(kws: list[str]) -> _KeywordPattern | None:
+        if not kws:
+            return None
+        alternation = "|".join(f"({re.escape(kw)})" for kw in kws)
+        return re.compile(f"(?=(?:{alternation}))"), kws
+
+    return _compile(ascii_kws), _compile(other_kws)
+
+
+def _keyword_hits(pattern: _KeywordPattern | None, text: str) -> set[str]:
+    """Return the keys of *pattern* found anywhere in *text*."""
+    if pattern is None:
+        return set()
+    regex, keys = pattern
+    return {keys[m.lastindex - 1] for m in regex.finditer(text)}
+
+
 def find_keyword_comments(
     comments: list[dict[str, Any]],
     keywords: list[str] | None = None,
@@ -349,18 +451,26 @@ def find_keyword_comments(
         from mizukilens.config import get_songlist_keywords
         keywords = get_songlist_keywords()
 
+    # All keywords are matched in one scan per comment, lowering it once.
+    ascii_pattern, other_pattern = _keyword_patterns(tuple(keywords))
+
     results: list[dict[str, Any]] = []
     for comment in comments:
         text = comment.get("text", "")
+        ascii_hits = _keyword_hits(ascii_pattern, text.lower()) if ascii_pattern else set()
+        other_hits = _keyword_hits(other_pattern, text)
+        if not ascii_hits and not other_hits:
+            continue
+
         matched: list[str] = []
         for kw in keywords:
             # Case-insensitive check for ASCII keywords
             if kw.isascii():
-                if kw.lower() in text.lower():
-                    matched.append(kw)
+                key, hits = kw.lower(), ascii_hits
             else:
-                if kw in text:
-                    matched.append(kw)
+                key, hits = kw, other_hits
+            if key in hits or any(hit.startswith(key) for hit in hits):
+                matched.append(kw)
         if matched:
             result = dict(comment)
             result["keywords_matched"] = matched
@@ -372,15 +482,14 @@ def find_keyword_comments(
 def _cache_keyword_candidates(
     conn: sqlite3.Connection,
     video_id: str,
-    comments: list[dict[str, Any]],
+    keyword_comments: list[dict[str, Any]],
 ) -> int:
-    """Scan comments for songlist keywords and save matches to candidate_comments.
+    """Save keyword-matched comments (from :func:`find_keyword_comments`) to candidate_comments.
 
     Returns the number of candidates saved.
     """
     from mizukilens.cache import save_candidate_comments
 
-    keyword_comments = find_keyword_comments(comments)
     if not keyword_comments:
         return 0
 
@@ -425,21 +534,17 @@ def find_candidate_comment(
     dict | None
         The best candidate comment dict, or *None* if no candidate qualifies.
     """
-    candidates = [
-        c for c in comments if count_timestamps(c.get("text", "")) >= MIN_TIMESTAMPS_REQUIRED
-    ]
-    if not candidates:
-        return None
+    # Single pass: filter and arg-max together, scoring each comment once
+    best: dict[str, Any] | None = None
+    best_key: tuple[int, int, int] | None = None
+    for c in comments:
+        key = _candidate_key(c)
+        if key is not None and (best_key is None or key > best_key):
+            best, best_key = c, key
+    return best
 
-    def _sort_key(c: dict[str, Any]) -> tuple[int, int, int]:
-        is_pinned = int(bool(c.get("is_pinned", False)))
-        # votes is a string like "1.2K" or "345" — parse it
-        votes = _parse_vote_count(c.get("votes", "0"))
-        ts_count = count_timestamps(c.get("text", ""))
-        # Higher = better; negate for sort if we sort ascending
-        return (is_pinned, votes, ts_count)
 
-    return max(candidates, key=_sort_key)
+_VOTE_SCALES = {"K": 1000, "k": 1000, "M": 1_000_000, "m": 1_000_000}
 
 
 def _parse_vote_count(votes: Any) -> int:
@@ -449,6 +554,22 @@ def _parse_vote_count(votes: Any) -> int:
     s = str(votes).strip().replace(",", "")
     if not s or s == "0":
         return 0
+
+    # Fast paths for YouTube's "digits[.digits][KkMm]" format, in exact
+    # integer arithmetic (no float round-trip).
+    if s.isascii():
+        if s.isdigit():
+            return int(s)
+        scale = _VOTE_SCALES.get(s[-1])
+        if scale is not None:
+            whole, dot, frac = s[:-1].partition(".")
+            if whole.isdigit() and (not dot or frac.isdigit()):
+                value = int(whole) * scale
+                if frac:
+                    value += int(frac) * scale // 10 ** len(frac)
+                return value
+
+    # Anything else (exponents, signs, stray text) takes the generic path
     try:
         if s.endswith("K") or s.endswith("k"):
             return int(float(s[:-1]) * 1000)
@@ -459,31 +580,103 @@ def _parse_vote_count(votes: Any) -> int:
         return 0
 
 
+def _candidate_key(comment: dict[str, Any]) -> tuple[int, int, int] | None:
+    """Return the ranking key of *comment*, or *None* if it does not qualify.
+
+    Keys compare as in :func:`find_candidate_comment`: pinned first, then
+    votes, then number of timestamps.
+    """
+    text = comment.get("text", "")
+    # Every timestamp contains a colon; skip the regex when there are too few.
+    if text.count(":") < MIN_TIMESTAMPS_REQUIRED:
+        return None
+    ts_count = count_timestamps(text)
+    if ts_count < MIN_TIMESTAMPS_REQUIRED:
+        return None
+    is_pinned = int(bool(comment.get("is_pinned", False)))
+    return (is_pinned, _parse_vote_count(comment.get("votes", "0")), ts_count)
+
+
+def _scan_comments(
+    comments: Iterable[dict[str, Any]],
+    keywords: list[str],
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    """Select the candidate comment and collect keyword matches in one pass.
+
+    *comments* is consumed lazily and never buffered.  Consumption stops as
+    soon as a qualifying pinned comment is seen: nothing can outrank it, and
+    for a live downloader this avoids fetching any further comment pages.
+
+    Returns
+    -------
+    tuple
+        ``(best_candidate_or_None, keyword_comments)``.
+    """
+    keyword_comments: list[dict[str, Any]] = []
+    best: dict[str, Any] | None = None
+    best_key: tuple[int, int, int] | None = None
+
+    for comment in comments:
+        keyword_comments.extend(find_keyword_comments((comment,), keywords))
+        key = _candidate_key(comment)
+        if key is not None and (best_key is None or key > best_key):
+            best, best_key = comment, key
+            if key[0]:
+                break
+
+    return best, keyword_comments
+
+
 # ---------------------------------------------------------------------------
 # Description fetching
 # ---------------------------------------------------------------------------
 
 
+# Same limit the former ``yt-dlp`` subprocess call had as its timeout.
+_YTDLP_SOCKET_TIMEOUT = 60
+
+# One YoutubeDL per thread: yt-dlp does not document instances as safe to
+# share, and the stamp server fetches descriptions from several threads.
+_ytdlp_local = threading.local()
+
+
+def _youtube_dl() -> Any:
+    """Return this thread's in-process :class:`yt_dlp.YoutubeDL` instance.
+
+    Created on first use in each thread and reused for every description
+    fetch there, so a batch run pays the yt-dlp import and HTTP session
+    setup once rather than spawning a new ``yt-dlp`` process per video.
+    """
+    ydl = getattr(_ytdlp_local, "ydl", None)
+    if ydl is None:
+        import yt_dlp  # local import — only needed when a description is fetched
+
+        ydl = yt_dlp.YoutubeDL({
+            "skip_download": True,
+            "quiet": True,
+            "no_warnings": True,
+            "socket_timeout": _YTDLP_SOCKET_TIMEOUT,
+        })
+        _ytdlp_local.ydl = ydl
+    return ydl
+
+
 def get_description_from_ytdlp(video_id: str) -> str | None:
-    """Fetch the video description using ``yt-dlp --skip-download --print description``.
+    """Fetch the video description via the yt-dlp Python API.
 
     Returns the description text, or *None* on failure.
     """
-    import subprocess
-
     url = f"https://www.youtube.com/watch?v={video_id}"
     try:
-        result = subprocess.run(
-            ["yt-dlp", "--skip-download", "--print", "description", url],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip() or None
-    except (subprocess.SubprocessError, FileNotFoundError, OSError):
-        pass
-    return None
+        info = _youtube_dl().extract_info(url, download=False, process=False)
+    except Exception:  # noqa: BLE001 — yt-dlp raises many error types
+        return None
+    if not isinstance(info, dict):
+        return None
+    description = info.get("description")
+    if not isinstance(description, str):
+        return None
+    return description.strip() or None
 
 
 def get_video_info_from_ytdlp(video_id: str) -> dict[str, str | None]:
@@ -599,12 +792,16 @@ def extract_timestamps(
         if comment_gen is None:
             comments_disabled = True
         else:
-            comments: list[dict[str, Any]] = list(comment_gen)
+            from mizukilens.config import get_songlist_keywords
 
-            # Cache keyword-matched comments as candidates for manual review
-            _cache_keyword_candidates(conn, video_id, comments)
+            # Stream the comments once: pick the candidate and collect
+            # keyword matches without materialising the full list.
+            selected_comment, keyword_comments = _scan_comments(
+                comment_gen, get_songlist_keywords()
+            )
 
-            selected_comment = find_candidate_comment(comments)
+            # Cache keyword-matched comments as candidates for manual review
+            _cache_keyword_candidates(conn, video_id, keyword_comments)
 
     except RuntimeError:
         # Comments disabled or failed to fetch
@@ -7,31 +7,50 @@ can back-fill the empty field automatically.
 
 from __future__ import annotations
 
+import sys
 import unicodedata
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True)
 class FillCandidate:
-    """One song whose ``originalArtist`` is empty."""
+    """One song whose ``originalArtist`` is empty.
+
+    ``artists`` may be shared between candidates with the same title and
+    must be treated as read-only.
+    """
 
     song_id: str
     title: str
     match_type: str  # "unique" | "ambiguous" | "no_match"
-    artists: dict[str, int] = field(default_factory=dict)
+    artists: Mapping[str, int] = field(default_factory=dict)
     chosen_artist: str | None = None
 
 
+# Shared, read-only artist counts for titles with no match.
+_NO_ARTISTS: Mapping[str, int] = MappingProxyType({})
+
+
+@lru_cache(maxsize=None)
 def normalize_title_for_matching(title: str) -> str:
     """Normalize a song title for fuzzy-ish matching.
 
-    Steps: strip → lowercase → NFKC normalize → collapse whitespace.
-    Conservative on purpose — avoids false positives.
+    Steps: strip → lowercase → NFKC normalize → collapse whitespace
+    (NFKC runs after lowercasing).
+    Conservative on purpose — avoids false positives.  Memoized: the same
+    titles recur across many livestreams.
     """
-    title = title.strip().lower()
-    title = unicodedata.normalize("NFKC", title)
-    return " ".join(title.split())
+    title = title.strip()
+    if not title.islower():  # already-lowercase titles need no copy
+        title = title.lower()
+    if not title.isascii():  # ASCII text is already NFKC-normal
+        title = unicodedata.normalize("NFKC", title)
+    # Interned: the result is used as a dict key for every song of the title.
+    return sys.intern(" ".join(title.split()))
 
 
 def compute_fill_plan(songs: list[dict]) -> list[FillCandidate]:
@@ -42,37 +61,52 @@ def compute_fill_plan(songs: list[dict]) -> list[FillCandidate]:
     distinct artist found among same-title songs), ``ambiguous`` (multiple
     artists), or ``no_match`` (no other song shares the title).
     """
-    # Step 1: index title → artist occurrences from songs WITH artists.
-    title_index: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    for song in songs:
-        artist = song.get("originalArtist", "")
-        if artist:
-            norm = normalize_title_for_matching(song.get("title", ""))
-            title_index[norm][artist] += 1
+    # Pull the two fields we need into parallel lists once, so the passes
+    # below index lists instead of probing each song dict again.
+    artists = [song.get("originalArtist", "") for song in songs]
+    if "" not in artists:
+        return []  # every song already has an artist (the common case)
+    titles = [song.get("title", "") for song in songs]
+    norms = list(map(normalize_title_for_matching, titles))
+
+    # Empty-artist songs to classify: (song_id, title, norm)
+    empties: list[tuple[str, str, str]] = [
+        (songs[i]["id"], titles[i], norms[i])
+        for i, artist in enumerate(artists)
+        if artist == ""
+    ]
+    needed = {norm for _, _, norm in empties}
+
+    # Step 1: index title → artist occurrences from songs WITH artists,
+    # limited to the titles some empty-artist song actually needs.
+    title_index: defaultdict[str, Counter[str]] = defaultdict(Counter)
+    for artist, norm in zip(artists, norms):
+        if artist and norm in needed:
+            title_index[norm][sys.intern(artist)] += 1
+
+    # Resolve each title once: its sole artist, or None if ambiguous.
+    title_resolved: dict[str, str | None] = {
+        norm: next(iter(counts)) if len(counts) == 1 else None
+        for norm, counts in title_index.items()
+    }
 
     # Step 2: classify empty-artist songs.
     candidates: list[FillCandidate] = []
-    for song in songs:
-        if song.get("originalArtist", "") != "":
-            continue  # already has artist
-
-        norm = normalize_title_for_matching(song.get("title", ""))
-        artist_counts = dict(title_index.get(norm, {}))
-
-        if not artist_counts:
-            match_type = "no_match"
-            chosen = None
-        elif len(artist_counts) == 1:
+    for song_id, title, norm in empties:
+        # Shared with every candidate of the same title — read-only.
+        artist_counts = title_index.get(norm) or _NO_ARTISTS
+        chosen = title_resolved.get(norm)
+        if chosen is not None:
             match_type = "unique"
-            chosen = next(iter(artist_counts))
-        else:
+        elif artist_counts:
             match_type = "ambiguous"
-            chosen = None
+        else:
+            match_type = "no_match"
 
         candidates.append(
             FillCandidate(
-                song_id=song["id"],
-                title=song.get("title", ""),
+                song_id=song_id,
+                title=title,
                 match_type=match_type,
                 artists=artist_counts,
                 chosen_artist=chosen,
@@ -82,10 +116,17 @@ def compute_fill_plan(songs: list[dict]) -> list[FillCandidate]:
     return candidates
 
 
-def apply_fill_plan(songs: list[dict], candidates: list[FillCandidate]) -> int:
+def apply_fill_plan(
+    songs: list[dict],
+    candidates: list[FillCandidate],
+    song_by_id: dict[str, dict] | None = None,
+) -> int:
     """Set ``originalArtist`` on songs where ``chosen_artist`` is set.
 
     Mutates *songs* in place.  Returns the number of songs updated.
+
+    When *song_by_id* (an ``id → song`` index over *songs*) is given, only
+    the songs in the plan are visited instead of scanning all of *songs*.
     """
     fill_map: dict[str, str] = {
         c.song_id: c.chosen_artist
@@ -96,6 +137,14 @@ def apply_fill_plan(songs: list[dict], candidates: list[FillCandidate]) -> int:
         return 0
 
     count = 0
+    if song_by_id is not None:
+        for song_id, artist in fill_map.items():
+            song = song_by_id.get(song_id)
+            if song is not None:
+                song["originalArtist"] = artist
+                count += 1
+        return count
+
     for song in songs:
         artist = fill_map.get(song["id"])
         if artist is not None:
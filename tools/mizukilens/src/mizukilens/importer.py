@@ -21,21 +21,33 @@ execute_import(plan, songs_path, streams_path, conn=None, video_ids=None)
 
 from __future__ import annotations
 
-import json
+import os
 import shutil
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+import orjson
+
+from mizukilens.cache import mark_streams_imported
+
+# orjson options for the MizukiPrism data files: 2-space indent, trailing newline
+_JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
 
 # ---------------------------------------------------------------------------
 # Timestamp conversion
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=8192)
 def timestamp_to_seconds(ts: str) -> int:
     """Convert 'H:MM:SS' or 'MM:SS' to seconds.
 
+    Memoized: the same timestamps (e.g. the ``"0:00:00"`` default) recur
+    across many versions of an export.
+
     Examples::
 
         timestamp_to_seconds("1:23:45")  # 5025
@@ -54,6 +66,60 @@ def timestamp_to_seconds(ts: str) -> int:
 # JSON schema validation
 # ---------------------------------------------------------------------------
 
+def _export_is_valid(payload: Any) -> bool:
+    """Return True if *payload* passes every check in :func:`validate_export_json`.
+
+    Straight-line fast path for the common (valid) case: no error strings
+    are built and it bails out at the first problem, leaving the detailed
+    messages to :func:`validate_export_json`.
+    """
+    if not isinstance(payload, dict) or not ("version" in payload and "source" in payload):
+        return False
+    data = payload.get("data")
+    if not isinstance(data, dict):
+        return False
+    streams = data.get("streams")
+    songs = data.get("songs")
+    versions = data.get("versions")
+    if not (isinstance(streams, list) and isinstance(songs, list) and isinstance(versions, list)):
+        return False
+
+    for stream in streams:
+        if not (
+            isinstance(stream, dict)
+            and isinstance(stream.get("id"), str)
+            and isinstance(stream.get("date"), str)
+            and isinstance(stream.get("title"), str)
+        ):
+            return False
+        if "commentCredit" in stream:
+            cc = stream["commentCredit"]
+            if not (isinstance(cc, dict) and isinstance(cc.get("author"), str)):
+                return False
+
+    for song in songs:
+        if not (
+            isinstance(song, dict)
+            and isinstance(song.get("id"), str)
+            and isinstance(song.get("name"), str)
+        ):
+            return False
+        if "artist" in song and not isinstance(song["artist"], str):
+            return False
+
+    for ver in versions:
+        if not (
+            isinstance(ver, dict)
+            and isinstance(ver.get("id"), str)
+            and isinstance(ver.get("songId"), str)
+            and isinstance(ver.get("streamId"), str)
+            and isinstance(ver.get("startTimestamp"), str)
+        ):
+            return False
+
+    return True
+
+
 def validate_export_json(payload: Any) -> None:
     """Validate the MizukiLens export JSON structure.
 
@@ -61,6 +127,9 @@ def validate_export_json(payload: Any) -> None:
         ValueError: With a descriptive message if any required field is missing
             or has the wrong type.
     """
+    if _export_is_valid(payload):
+        return
+
     errors: list[str] = []
 
     if not isinstance(payload, dict):
@@ -71,24 +140,25 @@ def validate_export_json(payload: Any) -> None:
         if key not in payload:
             errors.append(f"Missing top-level key: '{key}'")
 
-    if errors:
-        raise ValueError("Export JSON validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
-
+    # Every problem is collected and reported together at the end; sections
+    # whose container is missing or malformed are simply skipped.
     data = payload.get("data", {})
     if not isinstance(data, dict):
-        raise ValueError("'data' must be a JSON object")
-
-    for key in ("streams", "songs", "versions"):
-        if key not in data:
-            errors.append(f"Missing data key: '{key}'")
-        elif not isinstance(data[key], list):
-            errors.append(f"'data.{key}' must be an array")
-
-    if errors:
-        raise ValueError("Export JSON validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
+        errors.append("'data' must be a JSON object")
+        data = {}
+    elif "data" in payload:
+        for key in ("streams", "songs", "versions"):
+            if key not in data:
+                errors.append(f"Missing data key: '{key}'")
+            elif not isinstance(data[key], list):
+                errors.append(f"'data.{key}' must be an array")
+
+    def _items(key: str) -> list:
+        value = data.get(key)
+        return value if isinstance(value, list) else []
 
     # Validate each stream
-    for i, stream in enumerate(data["streams"]):
+    for i, stream in enumerate(_items("streams")):
         if not isinstance(stream, dict):
             errors.append(f"data.streams[{i}] must be an object")
             continue
@@ -106,7 +176,7 @@ def validate_export_json(payload: Any) -> None:
                 errors.append(f"data.streams[{i}].commentCredit.author must be a string")
 
     # Validate each song
-    for i, song in enumerate(data["songs"]):
+    for i, song in enumerate(_items("songs")):
         if not isinstance(song, dict):
             errors.append(f"data.songs[{i}] must be an object")
             continue
@@ -119,7 +189,7 @@ def validate_export_json(payload: Any) -> None:
             errors.append(f"data.songs[{i}].artist must be a string")
 
     # Validate each version
-    for i, ver in enumerate(data["versions"]):
+    for i, ver in enumerate(_items("versions")):
         if not isinstance(ver, dict):
             errors.append(f"data.versions[{i}] must be an object")
             continue
@@ -162,7 +232,11 @@ def _next_stream_id(existing_streams: list[dict], date: str) -> str:
     Format: ``stream-YYYY-MM-DD``.  If that already exists, try
     ``stream-YYYY-MM-DD-a``, ``-b``, etc.
     """
-    existing_ids = {s.get("id", "") for s in existing_streams}
+    return _stream_id_for_date({s.get("id", "") for s in existing_streams}, date)
+
+
+def _stream_id_for_date(existing_ids: set[str], date: str) -> str:
+    """Same as :func:`_next_stream_id`, given the set of taken stream IDs."""
     base = f"stream-{date}"
     if base not in existing_ids:
         return base
@@ -179,6 +253,43 @@ def _next_song_id(existing_songs: list[dict]) -> str:
     return f"song-{n}"
 
 
+def _copy_song_for_merge(song: dict) -> dict:
+    """Copy *song* deeply enough for an import to append performances to it.
+
+    The song dict and its ``performances`` list are copied; the performance
+    dicts, tags and other values are shared, as the import never mutates
+    them.  Much cheaper than :func:`copy.deepcopy`.
+    """
+    song_copy = dict(song)
+    performances = song_copy.get("performances")
+    if isinstance(performances, list):
+        song_copy["performances"] = list(performances)
+    return song_copy
+
+
+def _copy_songs_for_merge(songs: list[dict]) -> list[dict]:
+    """Apply :func:`_copy_song_for_merge` to every song in *songs*."""
+    return [_copy_song_for_merge(song) for song in songs]
+
+
+def _index_songs(songs: list[dict]) -> dict[str, int]:
+    """Map each song ID to its 1-based position in *songs* (first occurrence wins)."""
+    index: dict[str, int] = {}
+    for i, song in enumerate(songs, 1):
+        index.setdefault(song["id"], i)
+    return index
+
+
+def _stream_performance_fields(stream: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields every performance copies from its MizukiPrism *stream*."""
+    return {
+        "streamId": stream["id"],
+        "date": stream.get("date", ""),
+        "streamTitle": stream.get("title", ""),
+        "videoId": stream.get("videoId", ""),
+    }
+
+
 def _make_performance_id(song_index: int, perf_index: int) -> str:
     """Generate performance ID following MizukiPrism convention: 'p{songIdx}-{perfIdx}'."""
     return f"p{song_index}-{perf_index}"
@@ -213,6 +324,8 @@ class ImportPlan:
     _merged_songs: list[dict[str, Any]] = field(default_factory=list, repr=False)
     # All streams after merge (existing + new)
     _merged_streams: list[dict[str, Any]] = field(default_factory=list, repr=False)
+    # Prism song ID → 1-based position in _merged_songs (first occurrence)
+    _song_idx_by_id: dict[str, int] = field(default_factory=dict, repr=False)
 
     @property
     def new_song_count(self) -> int:
@@ -254,24 +367,25 @@ def load_mizukiprism_data(
     songs_path = Path(songs_path)
     streams_path = Path(streams_path)
 
+    # Read raw bytes: orjson parses UTF-8 directly, no intermediate str
     try:
-        songs_text = songs_path.read_text(encoding="utf-8")
+        songs_bytes = songs_path.read_bytes()
     except FileNotFoundError:
         raise FileNotFoundError(f"MizukiPrism songs file not found: {songs_path}")
 
     try:
-        streams_text = streams_path.read_text(encoding="utf-8")
+        streams_bytes = streams_path.read_bytes()
     except FileNotFoundError:
         raise FileNotFoundError(f"MizukiPrism streams file not found: {streams_path}")
 
     try:
-        songs = json.loads(songs_text)
-    except json.JSONDecodeError as exc:
+        songs = orjson.loads(songs_bytes)
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"songs.json is not valid JSON: {exc}") from exc
 
     try:
-        streams = json.loads(streams_text)
-    except json.JSONDecodeError as exc:
+        streams = orjson.loads(streams_bytes)
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"streams.json is not valid JSON: {exc}") from exc
 
     if not isinstance(songs, list):
@@ -307,13 +421,13 @@ def compute_import_plan(
     Returns:
         An :class:`ImportPlan` describing what will be added/updated.
     """
-    import copy
-
     plan = ImportPlan()
 
-    # Work on deep copies so we don't mutate caller's data
-    merged_songs: list[dict] = copy.deepcopy(existing_songs)
-    merged_streams: list[dict] = copy.deepcopy(existing_streams)
+    # Work on copies so we don't mutate caller's data.  Streams are only
+    # appended to, so sharing the dicts is safe; songs only ever get new
+    # performances appended, so each needs its own dict and list only.
+    merged_songs: list[dict] = _copy_songs_for_merge(existing_songs)
+    merged_streams: list[dict] = list(existing_streams)
 
     data = payload["data"]
     export_streams: list[dict] = data["streams"]
@@ -332,6 +446,11 @@ def compute_import_plan(
         if s.get("title")
     }
 
+    # ID allocation state, computed once and advanced as entities are added
+    # (instead of rescanning the merged lists for every new stream / song)
+    taken_stream_ids: set[str] = {s.get("id", "") for s in merged_streams}
+    next_song_n = _max_id_number(merged_songs, "song") + 1
+
     # --- Step 1: Map export streams to MizukiPrism streams ---
     mlens_stream_to_prism: dict[str, dict] = {}  # mlens video_id → prism stream dict
 
@@ -353,7 +472,8 @@ def compute_import_plan(
             mlens_stream_to_prism[mlens_video_id] = existing_stream
         else:
             # New stream: generate ID
-            new_stream_id = _next_stream_id(merged_streams, stream_date)
+            new_stream_id = _stream_id_for_date(taken_stream_ids, stream_date)
+            taken_stream_ids.add(new_stream_id)
             new_stream: dict[str, Any] = {
                 "id": new_stream_id,
                 "title": stream_title,
@@ -377,9 +497,9 @@ def compute_import_plan(
             mlens_stream_to_prism[mlens_video_id] = new_stream
             plan.new_streams.append(new_stream)
 
-    # --- Step 2: Build song id map (mlens song id → export song dict) ---
-    mlens_song_by_id: dict[str, dict] = {s["id"]: s for s in export_songs}
+    conflict_video_ids: set[str] = {c.video_id for c in plan.conflicts}
 
+    # --- Step 2: Map export songs to MizukiPrism songs ---
     # Map mlens song id → prism song dict
     mlens_song_to_prism: dict[str, dict] = {}
 
@@ -394,12 +514,14 @@ def compute_import_plan(
             mlens_song_to_prism[mlens_song_id] = existing_song_lookup[match_key]
         else:
             # New song: generate ID
-            new_song_id = _next_song_id(merged_songs)
+            new_song_id = f"song-{next_song_n}"
+            next_song_n += 1
+            tags = export_song.get("tags")
             new_song: dict[str, Any] = {
                 "id": new_song_id,
                 "title": name,
                 "originalArtist": artist,
-                "tags": list(export_song.get("tags", [])),
+                "tags": list(tags) if tags else [],
                 "performances": [],
             }
             merged_songs.append(new_song)
@@ -408,8 +530,15 @@ def compute_import_plan(
             plan.new_songs.append(new_song)
 
     # --- Step 3: Map versions to performances and embed in songs ---
+    song_idx_by_id = _index_songs(merged_songs)
+
     # Track which songs got new performances for reporting
-    songs_updated_perf_counts: dict[str, int] = {}  # prism song id → new perf count
+    # (existing songs carry their new-performance count as "_new_perf_count",
+    # which _clean_song strips before writing)
+    new_song_ids = {s["id"] for s in plan.new_songs}
+
+    # Per-stream performance fields, built once per stream rather than per version
+    stream_fields_by_id: dict[str, dict[str, Any]] = {}
 
     for export_ver in export_versions:
         mlens_song_id: str = export_ver["songId"]
@@ -426,19 +555,16 @@ def compute_import_plan(
             continue  # orphaned version, skip
 
         # Skip performances for conflicted streams (will be handled in execute based on user choice)
-        is_conflict = any(c.video_id == mlens_stream_id for c in plan.conflicts)
-        if is_conflict:
+        if mlens_stream_id in conflict_video_ids:
             continue
 
-        # Find song index in merged_songs
-        try:
-            song_idx = next(
-                i + 1  # 1-based index matching MizukiPrism convention (song-1 → p1-N)
-                for i, s in enumerate(merged_songs)
-                if s["id"] == target_song["id"]
-            )
-        except StopIteration:
-            song_idx = 1
+        stream_fields = stream_fields_by_id.get(mlens_stream_id)
+        if stream_fields is None:
+            stream_fields = _stream_performance_fields(target_stream)
+            stream_fields_by_id[mlens_stream_id] = stream_fields
+
+        # 1-based index in merged_songs, matching MizukiPrism convention (song-1 → p1-N)
+        song_idx = song_idx_by_id.get(target_song["id"], 1)
 
         # Count existing performances in this song
         existing_perf_count = len(target_song.get("performances", []))
@@ -464,10 +590,7 @@ def compute_import_plan(
 
         performance: dict[str, Any] = {
             "id": perf_id,
-            "streamId": target_stream["id"],
-            "date": target_stream.get("date", ""),
-            "streamTitle": target_stream.get("title", ""),
-            "videoId": target_stream.get("videoId", ""),
+            **stream_fields,
             "timestamp": timestamp_seconds,
             "endTimestamp": end_timestamp,
             "note": export_ver.get("note", ""),
@@ -476,23 +599,15 @@ def compute_import_plan(
         target_song.setdefault("performances", []).append(performance)
 
         # Track count for reporting
-        prism_song_id = target_song["id"]
-        songs_updated_perf_counts[prism_song_id] = songs_updated_perf_counts.get(prism_song_id, 0) + 1
-
-    # --- Step 4: Tag updated (existing) songs with new perf counts ---
-    new_song_ids = {s["id"] for s in plan.new_songs}
-    for prism_song_id, new_count in songs_updated_perf_counts.items():
-        if prism_song_id not in new_song_ids:
-            # Find the song in merged_songs
-            for s in merged_songs:
-                if s["id"] == prism_song_id:
-                    updated_copy = dict(s)
-                    updated_copy["_new_perf_count"] = new_count
-                    plan.updated_songs.append(updated_copy)
-                    break
+        if target_song["id"] not in new_song_ids:
+            new_count = target_song.get("_new_perf_count", 0) + 1
+            target_song["_new_perf_count"] = new_count
+            if new_count == 1:
+                plan.updated_songs.append(target_song)
 
     plan._merged_songs = merged_songs
     plan._merged_streams = merged_streams
+    plan._song_idx_by_id = song_idx_by_id
 
     # Build the song/stream ID maps for execute_import
     plan._song_id_map = mlens_song_to_prism
@@ -506,41 +621,31 @@ def compute_import_plan(
 # ---------------------------------------------------------------------------
 
 def _add_performances_for_stream(
-    payload: dict[str, Any],
+    stream_versions: Iterable[dict],
     plan: ImportPlan,
     mlens_stream_id: str,
 ) -> None:
     """Add performances for a conflicting stream to the plan's merged songs.
 
-    Called when the user chooses to overwrite a conflicting stream.
+    Called when the user chooses to overwrite a conflicting stream, with the
+    export versions whose ``streamId`` is *mlens_stream_id*.
     Mutates plan._merged_songs in place.
     """
-    data = payload["data"]
-    export_versions: list[dict] = data["versions"]
-    merged_songs = plan._merged_songs
+    song_idx_by_id = plan._song_idx_by_id or _index_songs(plan._merged_songs)
 
     target_stream = plan._stream_id_map.get(mlens_stream_id)
     if target_stream is None:
         return
+    stream_fields = _stream_performance_fields(target_stream)
 
-    for export_ver in export_versions:
-        if export_ver["streamId"] != mlens_stream_id:
-            continue
-
+    for export_ver in stream_versions:
         mlens_song_id: str = export_ver["songId"]
         target_song = plan._song_id_map.get(mlens_song_id)
         if target_song is None:
             continue
 
-        # Find song index in merged_songs
-        try:
-            song_idx = next(
-                i + 1
-                for i, s in enumerate(merged_songs)
-                if s["id"] == target_song["id"]
-            )
-        except StopIteration:
-            song_idx = 1
+        # 1-based index in merged_songs
+        song_idx = song_idx_by_id.get(target_song["id"], 1)
 
         existing_perf_count = len(target_song.get("performances", []))
         new_perf_index = existing_perf_count + 1
@@ -564,10 +669,7 @@ def _add_performances_for_stream(
 
         performance: dict[str, Any] = {
             "id": perf_id,
-            "streamId": target_stream["id"],
-            "date": target_stream.get("date", ""),
-            "streamTitle": target_stream.get("title", ""),
-            "videoId": target_stream.get("videoId", ""),
+            **stream_fields,
             "timestamp": timestamp_seconds,
             "endTimestamp": end_timestamp,
             "note": export_ver.get("note", ""),
@@ -594,6 +696,68 @@ class ImportResult:
     skipped_count: int
 
 
+def _backup_file(path: Path) -> None:
+    """Preserve the current *path* as ``<name>.json.bak``.
+
+    A hard link is enough because :func:`_replace_json_files` swaps in a new
+    inode rather than rewriting the old one; falls back to a copy where the
+    filesystem does not support links.
+    """
+    backup_path = path.with_suffix(".json.bak")
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+
+
+def _write_json_temp(path: Path, data: Any) -> Path:
+    """Write *data* as indented JSON to a sibling temp file of *path*.
+
+    The temp file lives on the same filesystem as *path* (so the later
+    rename is atomic), is fsynced, and takes over *path*'s file mode.
+    Returns the temp file's path.
+    """
+    tmp_path = path.with_suffix(".json.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=_JSON_FILE_OPTIONS))
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def _replace_json_files(files: list[tuple[Path, Any]]) -> None:
+    """Atomically replace each ``(path, data)`` in *files* with its JSON.
+
+    The temp files are written and fsynced concurrently (the fsyncs dominate
+    and release the GIL); only once all of them succeeded are they renamed
+    over their targets, so a failure leaves every target untouched.
+    """
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        futures = [pool.submit(_write_json_temp, path, data) for path, data in files]
+
+    tmp_paths: list[Path] = []
+    error: BaseException | None = None
+    for future in futures:
+        try:
+            tmp_paths.append(future.result())
+        except BaseException as exc:
+            error = error or exc
+    if error is not None:
+        for tmp_path in tmp_paths:
+            tmp_path.unlink(missing_ok=True)
+        raise error
+
+    for tmp_path, (path, _) in zip(tmp_paths, files):
+        os.replace(tmp_path, path)
+
+
 def execute_import(
     plan: ImportPlan,
     songs_path: str | Path,
@@ -619,23 +783,38 @@ def execute_import(
     Returns:
         An :class:`ImportResult` with operation summary.
     """
-    import copy
-
     songs_path = Path(songs_path)
     streams_path = Path(streams_path)
     overwrite_video_ids = overwrite_video_ids or set()
     skip_video_ids = skip_video_ids or set()
 
-    # Apply conflict resolution on a copy of the plan's merged data
-    merged_songs = copy.deepcopy(plan._merged_songs)
-    merged_streams = copy.deepcopy(plan._merged_streams)
+    overwritten_count = 0
+    skipped_count = 0
 
-    # Rebuild _song_id_map and _stream_id_map pointing to the deep copies
-    # so _add_performances_for_stream can mutate them
+    # Export versions of the overwritten conflicts, grouped by streamId
+    versions_by_stream: dict[str, list[dict]] = {}
+    if payload is not None:
+        for v in payload.get("data", {}).get("versions", []):
+            versions_by_stream.setdefault(v.get("streamId"), []).append(v)
+
+    # Conflict resolution must leave the plan untouched, but only the songs
+    # that overwritten streams add performances to are actually written to:
+    # copy those, share everything else.
+    touched_song_ids: set[str] = set()
+    for video_id in overwrite_video_ids:
+        for v in versions_by_stream.get(video_id, ()):
+            target = plan._song_id_map.get(v["songId"])
+            if target is not None:
+                touched_song_ids.add(target["id"])
+    merged_songs = [
+        _copy_song_for_merge(s) if s["id"] in touched_song_ids else s
+        for s in plan._merged_songs
+    ]
+    merged_streams = list(plan._merged_streams)  # streams are never mutated
+
+    # Proxy plan whose song map points at the copies, so
+    # _add_performances_for_stream mutates them instead of the plan
     id_to_merged_song: dict[str, dict] = {s["id"]: s for s in merged_songs}
-    id_to_merged_stream: dict[str, dict] = {s["id"]: s for s in merged_streams}
-
-    # Re-create proxy maps pointing to deep copies
     proxy_plan = ImportPlan(
         new_songs=plan.new_songs,
         updated_songs=plan.updated_songs,
@@ -644,24 +823,22 @@ def execute_import(
     )
     proxy_plan._merged_songs = merged_songs
     proxy_plan._merged_streams = merged_streams
+    proxy_plan._song_idx_by_id = plan._song_idx_by_id  # same order as the copies
     proxy_plan._song_id_map = {
         k: id_to_merged_song[v["id"]]
         for k, v in plan._song_id_map.items()
         if v["id"] in id_to_merged_song
     }
-    proxy_plan._stream_id_map = {
-        k: id_to_merged_stream[v["id"]]
-        for k, v in plan._stream_id_map.items()
-        if v["id"] in id_to_merged_stream
-    }
-
-    overwritten_count = 0
-    skipped_count = 0
+    proxy_plan._stream_id_map = plan._stream_id_map
 
     if payload is not None:
         for conflict in plan.conflicts:
             if conflict.video_id in overwrite_video_ids:
-                _add_performances_for_stream(payload, proxy_plan, conflict.video_id)
+                _add_performances_for_stream(
+                    versions_by_stream.get(conflict.video_id, ()),
+                    proxy_plan,
+                    conflict.video_id,
+                )
                 overwritten_count += 1
             else:
                 skipped_count += 1
@@ -675,40 +852,28 @@ def execute_import(
 
     # Backup originals
     if songs_path.exists():
-        shutil.copy2(songs_path, songs_path.with_suffix(".json.bak"))
+        _backup_file(songs_path)
     if streams_path.exists():
-        shutil.copy2(streams_path, streams_path.with_suffix(".json.bak"))
+        _backup_file(streams_path)
 
-    # Write updated files
-    with songs_path.open("w", encoding="utf-8") as fh:
-        json.dump(clean_songs, fh, ensure_ascii=False, indent=2)
-        fh.write("\n")
-
-    with streams_path.open("w", encoding="utf-8") as fh:
-        json.dump(clean_streams, fh, ensure_ascii=False, indent=2)
-        fh.write("\n")
+    # Write updated files (same layout as json.dump(..., indent=2) + "\n")
+    _replace_json_files([(songs_path, clean_songs), (streams_path, clean_streams)])
 
     # Update cache status for imported streams
     if conn is not None:
-        for stream in plan.new_streams:
-            video_id = stream.get("videoId")
-            if video_id:
-                _update_cache_imported(conn, video_id)
-
-        for video_id in overwrite_video_ids:
-            _update_cache_imported(conn, video_id)
+        video_ids = [s["videoId"] for s in plan.new_streams if s.get("videoId")]
+        video_ids.extend(overwrite_video_ids)
+        _update_cache_imported(conn, video_ids)
 
     # Compute actual counts
     new_version_count = plan.new_version_count
     if payload is not None:
         # Add versions from overwritten conflicts
-        for conflict in plan.conflicts:
-            if conflict.video_id in overwrite_video_ids:
-                data = payload.get("data", {})
-                versions = data.get("versions", [])
-                new_version_count += sum(
-                    1 for v in versions if v.get("streamId") == conflict.video_id
-                )
+        new_version_count += sum(
+            len(versions_by_stream.get(conflict.video_id, ()))
+            for conflict in plan.conflicts
+            if conflict.video_id in overwrite_video_ids
+        )
 
     return ImportResult(
         songs_path=songs_path,
@@ -722,22 +887,14 @@ def execute_import(
     )
 
 
-def _update_cache_imported(conn: sqlite3.Connection, video_id: str) -> None:
-    """Attempt to update a stream's cache status to 'imported'.
+def _update_cache_imported(conn: sqlite3.Connection, video_ids: list[str]) -> None:
+    """Attempt to update the streams' cache status to 'imported'.
 
-    Silently ignores errors (stream may not be in cache if imported from
-    an external file).
+    Allows exported → imported and approved → imported (via exported), in
+    one batched update.  Silently ignores errors (streams may not be in
+    cache if imported from an external file).
     """
     try:
-        from mizukilens.cache import get_stream, update_stream_status
-        stream = get_stream(conn, video_id)
-        if stream is not None:
-            current_status = stream["status"]
-            # Allow exported → imported or approved → imported (via exported)
-            if current_status in ("exported", "approved"):
-                # Need to go through exported first if currently approved
-                if current_status == "approved":
-                    update_stream_status(conn, video_id, "exported")
-                update_stream_status(conn, video_id, "imported")
+        mark_streams_imported(conn, video_ids)
     except Exception:  # noqa: BLE001
         pass
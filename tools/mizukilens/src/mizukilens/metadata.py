@@ -32,6 +32,18 @@ upsert_artist_info(records: list[dict], entry: dict) -> list[dict]
 fetch_song_metadata(song: dict, metadata_dir: Path, fetch_art: bool) -> FetchResult
     Fetch and persist metadata for a single song.
 
+RecordStore
+    Metadata records keyed by songId / normalizedArtist, with O(1) upserts.
+
+fetch_song_metadata_into(song: dict, metadata: RecordStore, artists: RecordStore, fetch_art: bool) -> FetchResult
+    Fetch metadata for a single song into already-loaded record stores.
+
+write_fetch_records(metadata_dir: Path, metadata: RecordStore, artists: RecordStore) -> None
+    Persist the record stores updated by fetch_song_metadata_into().
+
+plan_fetches(songs: list[dict], metadata_by_id: dict, mode: str, force: bool) -> list[dict]
+    Select the songs a ``metadata fetch`` run needs to call iTunes for.
+
 get_metadata_status(songs_path: Path, metadata_dir: Path) -> list[SongStatusRecord]
     Cross-reference songs.json with metadata files to compute per-song status.
 """
@@ -39,16 +51,23 @@ get_metadata_status(songs_path: Path, metadata_dir: Path) -> list[SongStatusReco
 from __future__ import annotations
 
 import json
+import os
 import re
+import threading
 import time
+import unicodedata
 import urllib.error
 import urllib.parse
-import urllib.request
+import warnings
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import httpx
+import orjson
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -60,24 +79,38 @@ ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
 _ITUNES_MIN_INTERVAL_SEC = 3.0
 _TIMEOUT_SEC = 5.0
 
+# Metadata files are written like json.dump(..., indent=2) + "\n"
+_JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
 # Staleness threshold: 90 days
 STALE_DAYS = 90
 
+# Batch fetches write the metadata files back every this many songs
+FETCH_CHECKPOINT_EVERY = 50
+
 
 # ---------------------------------------------------------------------------
 # Rate limiter state (module-level, shared across all calls in a session)
 # ---------------------------------------------------------------------------
 
 _last_itunes_call: float = 0.0
+_itunes_lock = threading.Lock()
 
 
 def _wait_itunes() -> None:
-    """Enforce minimum interval between iTunes API calls."""
+    """Enforce minimum interval between iTunes API calls.
+
+    Thread-safe (the stamp editor serves requests on several threads): each
+    caller reserves the next free slot under a lock, then sleeps until that
+    slot, outside the lock.
+    """
     global _last_itunes_call
-    elapsed = time.monotonic() - _last_itunes_call
-    if elapsed < _ITUNES_MIN_INTERVAL_SEC:
-        time.sleep(_ITUNES_MIN_INTERVAL_SEC - elapsed)
-    _last_itunes_call = time.monotonic()
+    with _itunes_lock:
+        now = time.monotonic()
+        slot = max(now, _last_itunes_call + _ITUNES_MIN_INTERVAL_SEC)
+        _last_itunes_call = slot
+    if slot > now:
+        time.sleep(slot - now)
 
 
 # ---------------------------------------------------------------------------
@@ -121,45 +154,62 @@ def _clean_title(title: str) -> str:
 # Artist name normalization
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def normalize_artist(name: str) -> str:
     """Normalize an artist name for use as an ArtistInfo lookup key.
 
-    Converts to lowercase, strips leading/trailing whitespace, and collapses
-    multiple internal spaces into a single space.
+    Applies NFKC (folding full-width letters and ideographic spaces),
+    converts to lowercase, strips leading/trailing whitespace, and collapses
+    multiple internal spaces into a single space.  Memoized, since most
+    artists cover many songs.
 
     Examples::
 
         normalize_artist("YOASOBI")         -> "yoasobi"
+        normalize_artist("ＹＯＡＳＯＢＩ")  -> "yoasobi"
         normalize_artist("  宇多田 光  ")   -> "宇多田 光"
         normalize_artist("Ado")             -> "ado"
     """
-    return " ".join(name.lower().strip().split())
+    if not name.isascii():  # NFKC never changes ASCII
+        name = unicodedata.normalize("NFKC", name)
+    return " ".join(name.lower().split())
 
 
 # ---------------------------------------------------------------------------
 # HTTP helper
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Return the shared HTTP client, created on first use.
+
+    Reusing one client keeps the connection (and its TLS session) to the
+    API host alive across calls instead of reconnecting for every request.
+    """
+    return httpx.Client(
+        headers={"User-Agent": "MizukiLens/1.0 (MizukiPrism curator tool)"},
+        follow_redirects=True,
+    )
+
+
 def _http_get_json(url: str, timeout: float = _TIMEOUT_SEC) -> Any:
     """Perform a GET request and return parsed JSON.
 
     Raises:
         urllib.error.URLError: On network failure.
         urllib.error.HTTPError: On non-2xx HTTP response.
-        TimeoutError: On connection/read timeout (mapped from socket.timeout).
+        TimeoutError: On connection/read timeout.
         json.JSONDecodeError: If the response is not valid JSON.
     """
-    import socket
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "MizukiLens/1.0 (MizukiPrism curator tool)"},
-    )
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            body = resp.read().decode("utf-8")
-            return json.loads(body)
-    except socket.timeout as exc:
+        resp = _http_client().get(url, timeout=timeout)
+    except httpx.TimeoutException as exc:
         raise TimeoutError(f"Request timed out: {url}") from exc
+    except httpx.HTTPError as exc:
+        raise urllib.error.URLError(str(exc)) from exc
+    if not resp.is_success:
+        raise urllib.error.HTTPError(url, resp.status_code, resp.reason_phrase, None, None)
+    return orjson.loads(resp.content)
 
 
 # ---------------------------------------------------------------------------
@@ -167,13 +217,17 @@ def _http_get_json(url: str, timeout: float = _TIMEOUT_SEC) -> Any:
 # ---------------------------------------------------------------------------
 
 def _itunes_search(query: str, country: str = "JP") -> list[dict]:
-    """Execute a single iTunes search and return the results list."""
+    """Execute a single iTunes search and return the results list.
+
+    Only the top hit is ever used, so only one result is requested.
+    """
     _wait_itunes()
-    params = urllib.parse.urlencode({
-        "term": query, "media": "music", "entity": "song",
-        "country": country, "limit": "10",
-    })
-    url = f"{ITUNES_SEARCH_URL}?{params}"
+    # Same query string urlencode() would build; only term/country vary
+    quote = urllib.parse.quote_plus
+    url = (
+        f"{ITUNES_SEARCH_URL}?term={quote(query)}&media=music&entity=song"
+        f"&country={quote(country)}&limit=1"
+    )
     try:
         data = _http_get_json(url)
     except TimeoutError:
@@ -211,6 +265,10 @@ def fetch_itunes_metadata(original_artist: str, title: str) -> dict | None:
       3. ``<title>`` with country=JP → fuzzy
       4. ``<cleaned_title>`` (if special punct) with country=JP → fuzzy_cleaned
 
+    Strategies whose query is the same as an earlier one up to whitespace
+    (e.g. ``<artist> <title>`` with an empty artist) or empty are skipped,
+    as they would only repeat a rate-limited call with the same outcome.
+
     Returns a dict with keys: track_result, match_confidence, and the
     extracted iTunes metadata. Returns None only when no API call succeeded
     (network error propagated).
@@ -233,8 +291,13 @@ def fetch_itunes_metadata(original_artist: str, title: str) -> dict | None:
         strategies.append((cleaned_title, "fuzzy_cleaned"))
 
     last_error: str | None = None
+    tried: set[str] = set()
 
     for query, confidence in strategies:
+        query = " ".join(query.split())
+        if not query or query in tried:
+            continue
+        tried.add(query)
         try:
             results = _itunes_search(query)
         except TimeoutError:
@@ -267,16 +330,13 @@ def read_metadata_file(path: Path) -> list[dict]:
     if not path.exists():
         return []
     try:
-        text = path.read_text(encoding="utf-8")
-        data = json.loads(text)
+        data = orjson.loads(path.read_bytes())
         if isinstance(data, list):
             return data
         # File contains non-list JSON — treat as corrupted
-        import warnings
         warnings.warn(f"Metadata file {path} does not contain a JSON array; initializing empty.", stacklevel=2)
         return []
-    except (json.JSONDecodeError, OSError) as exc:
-        import warnings
+    except (orjson.JSONDecodeError, OSError) as exc:
         warnings.warn(f"Could not read metadata file {path}: {exc}; initializing empty.", stacklevel=2)
         return []
 
@@ -284,15 +344,18 @@ def read_metadata_file(path: Path) -> list[dict]:
 def write_metadata_file(path: Path, data: list[dict]) -> None:
     """Atomically write a JSON array to a metadata file.
 
-    Creates parent directories if necessary.
+    Creates parent directories if necessary.  The content is fsynced before
+    the rename, so *path* never points at a partially written file; call
+    :func:`_fsync_dir` on the parent to make the rename itself durable.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     # Write to a temp file first, then rename for atomicity
     tmp_path = path.with_suffix(".json.tmp")
     try:
-        with tmp_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
-            fh.write("\n")
+        with tmp_path.open("wb") as fh:
+            fh.write(orjson.dumps(data, option=_JSON_FILE_OPTIONS))
+            fh.flush()
+            os.fsync(fh.fileno())
         tmp_path.replace(path)
     except Exception:
         if tmp_path.exists():
@@ -300,6 +363,20 @@ def write_metadata_file(path: Path, data: list[dict]) -> None:
         raise
 
 
+def _fsync_dir(path: Path) -> None:
+    """Flush directory *path* so renames into it survive a crash.
+
+    A no-op on platforms that cannot open directories (Windows).
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 # ---------------------------------------------------------------------------
 # Upsert helpers
 # ---------------------------------------------------------------------------
@@ -328,6 +405,42 @@ def upsert_artist_info(records: list[dict], entry: dict) -> list[dict]:
     return new_records
 
 
+@dataclass
+class RecordStore:
+    """Metadata records keyed by *key_field*, for many upserts in a row.
+
+    :meth:`upsert` is O(1) but otherwise behaves like the list-based
+    ``upsert_*`` helpers: the upserted record moves to the end.  Records
+    without a usable key are kept in place.
+    """
+
+    key_field: str
+    by_key: dict[Any, dict] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, records: list[dict], key_field: str) -> RecordStore:
+        """Build a store from a record list as read by :func:`read_metadata_file`."""
+        by_key: dict[Any, dict] = {}
+        for record in records:
+            key = record.get(key_field)
+            by_key[object() if key is None else key] = record
+        return cls(key_field, by_key)
+
+    def get(self, key: str) -> dict | None:
+        """Return the record stored under *key*, or None."""
+        return self.by_key.get(key)
+
+    def upsert(self, entry: dict) -> None:
+        """Insert *entry*, replacing any record with the same key."""
+        key = entry[self.key_field]
+        self.by_key.pop(key, None)
+        self.by_key[key] = entry
+
+    def records(self) -> list[dict]:
+        """Return the records as a list, in file order."""
+        return list(self.by_key.values())
+
+
 # ---------------------------------------------------------------------------
 # FetchResult dataclass
 # ---------------------------------------------------------------------------
@@ -366,13 +479,64 @@ def fetch_song_metadata(
     """Fetch and persist metadata for a single song.
 
     Reads the metadata JSON files, performs API calls, upserts the
-    results, and writes the files back.
+    results, and writes the files back.  To fetch many songs, load the
+    records once and use :func:`fetch_song_metadata_into` instead.
 
     Args:
         song: A song dict with at least ``id``, ``title``, ``originalArtist``.
         metadata_dir: Path to the ``data/metadata/`` directory.
         fetch_art: Whether to call the iTunes API.
 
+    Returns:
+        A :class:`FetchResult` describing what was fetched.
+    """
+    metadata = RecordStore.from_records(
+        read_metadata_file(metadata_dir / "song-metadata.json"), "songId",
+    )
+    artists = RecordStore.from_records(
+        read_metadata_file(metadata_dir / "artist-info.json"), "normalizedArtist",
+    )
+
+    result = fetch_song_metadata_into(song, metadata, artists, fetch_art)
+
+    # --- Persist ---
+    if fetch_art:
+        write_fetch_records(metadata_dir, metadata, artists)
+
+    return result
+
+
+def write_fetch_records(
+    metadata_dir: Path,
+    metadata: RecordStore,
+    artists: RecordStore,
+) -> None:
+    """Write the SongMetadata and ArtistInfo records back to *metadata_dir*.
+
+    Both renames are committed with a single directory fsync.
+    """
+    write_metadata_file(metadata_dir / "song-metadata.json", metadata.records())
+    write_metadata_file(metadata_dir / "artist-info.json", artists.records())
+    _fsync_dir(metadata_dir)
+
+
+def fetch_song_metadata_into(
+    song: dict,
+    metadata: RecordStore,
+    artists: RecordStore,
+    fetch_art: bool = True,
+) -> FetchResult:
+    """Fetch metadata for a single song into already-loaded record stores.
+
+    Performs the API calls and upserts the results into *metadata* and
+    *artists*; nothing is written to disk (see :func:`write_fetch_records`).
+
+    Args:
+        song: A song dict with at least ``id``, ``title``, ``originalArtist``.
+        metadata: song-metadata.json records, keyed by ``songId``.
+        artists: artist-info.json records, keyed by ``normalizedArtist``.
+        fetch_art: Whether to call the iTunes API.
+
     Returns:
         A :class:`FetchResult` describing what was fetched.
     """
@@ -380,14 +544,6 @@ def fetch_song_metadata(
     title: str = song.get("title", "")
     original_artist: str = song.get("originalArtist", "")
 
-    # File paths
-    metadata_path = metadata_dir / "song-metadata.json"
-    artist_path = metadata_dir / "artist-info.json"
-
-    # Load current records
-    metadata_records = read_metadata_file(metadata_path)
-    artist_records = read_metadata_file(artist_path)
-
     now = _now_iso()
 
     # --- iTunes ---
@@ -421,7 +577,7 @@ def fetch_song_metadata(
                 "fetchedAt": now,
                 "lastError": None,
             }
-            metadata_records = upsert_song_metadata(metadata_records, song_meta_entry)
+            metadata.upsert(song_meta_entry)
 
             # Upsert ArtistInfo
             itunes_artist_name = itunes_result.get("artistName", original_artist)
@@ -431,7 +587,7 @@ def fetch_song_metadata(
                 "itunesArtistId": itunes_result.get("itunesTrackId"),
                 "fetchedAt": now,
             }
-            artist_records = upsert_artist_info(artist_records, artist_entry)
+            artists.upsert(artist_entry)
         else:
             # No match or error
             last_err = itunes_result.get("last_error")
@@ -454,12 +610,7 @@ def fetch_song_metadata(
                 "fetchedAt": now,
                 "lastError": art_error,
             }
-            metadata_records = upsert_song_metadata(metadata_records, song_meta_entry)
-
-    # --- Persist ---
-    if fetch_art:
-        write_metadata_file(metadata_path, metadata_records)
-        write_metadata_file(artist_path, artist_records)
+            metadata.upsert(song_meta_entry)
 
     return FetchResult(
         song_id=song_id,
@@ -475,26 +626,85 @@ def fetch_song_metadata(
 # Staleness check helper
 # ---------------------------------------------------------------------------
 
-def is_stale(entry: dict) -> bool:
-    """Return True if the entry's fetchedAt is older than STALE_DAYS days."""
+@lru_cache(maxsize=8192)
+def _parse_fetched_at(value: str) -> datetime:
+    """Parse a fetchedAt timestamp as an aware datetime (naive means UTC).
+
+    Memoized: a batch fetch stamps many entries with nearly the same values.
+    """
+    fetched_at = datetime.fromisoformat(value)
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return fetched_at
+
+
+def is_stale(entry: dict, now: datetime | None = None) -> bool:
+    """Return True if the entry's fetchedAt is older than STALE_DAYS days.
+
+    Pass *now* (an aware datetime) when checking many entries in a row.
+    """
     fetched_at_str = entry.get("fetchedAt")
     if not fetched_at_str:
         return True
     try:
-        fetched_at = datetime.fromisoformat(fetched_at_str)
-        if fetched_at.tzinfo is None:
-            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
-        age = datetime.now(tz=timezone.utc) - fetched_at
+        fetched_at = _parse_fetched_at(fetched_at_str)
+        age = (now or datetime.now(tz=timezone.utc)) - fetched_at
         return age.days >= STALE_DAYS
     except (ValueError, TypeError):
         return True
 
 
+# ---------------------------------------------------------------------------
+# Fetch planning
+# ---------------------------------------------------------------------------
+
+def plan_fetches(
+    songs: list[dict],
+    metadata_by_id: dict[str, dict],
+    mode: str,
+    force: bool = False,
+) -> list[dict]:
+    """Select the songs that need an iTunes lookup, before any HTTP call.
+
+    Args:
+        songs: All songs from songs.json.
+        metadata_by_id: Existing SongMetadata records keyed by ``songId``,
+            built once by the caller.
+        mode: ``"missing"`` (no entry yet), ``"stale"`` (entry older than
+            :data:`STALE_DAYS`) or ``"all"``.
+        force: In ``"all"`` mode, also re-fetch ``manual`` entries.
+
+    Returns:
+        The songs to fetch, in songs.json order.
+    """
+    if mode == "missing":
+        return [s for s in songs if s.get("id") not in metadata_by_id]
+    if mode == "stale":
+        now = datetime.now(tz=timezone.utc)
+        targets: list[dict] = []
+        for s in songs:
+            entry = metadata_by_id.get(s.get("id"))
+            if entry is not None and is_stale(entry, now):
+                targets.append(s)
+        return targets
+    if mode == "all":
+        if force:
+            return list(songs)
+        # Skip manual entries unless forced
+        targets = []
+        for s in songs:
+            entry = metadata_by_id.get(s.get("id", ""))
+            if entry is None or entry.get("fetchStatus") != "manual":
+                targets.append(s)
+        return targets
+    return []
+
+
 # ---------------------------------------------------------------------------
 # Metadata status
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SongStatusRecord:
     """Per-song metadata status, computed by cross-referencing data files."""
 
@@ -526,13 +736,10 @@ def get_metadata_status(
         A list of :class:`SongStatusRecord`, one per song in songs.json,
         in the same order as songs.json.
     """
-    import json as _json
-
     # Load songs
     try:
-        raw = songs_path.read_text(encoding="utf-8")
-        all_songs: list[dict] = _json.loads(raw)
-    except (OSError, _json.JSONDecodeError):
+        all_songs: list[dict] = orjson.loads(songs_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
         all_songs = []
     if not isinstance(all_songs, list):
         all_songs = []
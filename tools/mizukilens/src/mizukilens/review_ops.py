@@ -9,16 +9,20 @@ from __future__ import annotations
 
 import re
 import sqlite3
+from functools import lru_cache
 
 from rich import box
 from rich.console import Console
 from rich.table import Table
 
 from mizukilens.cache import (
+    find_parsed_songs_glob,
     get_parsed_songs,
+    get_report_aggregates,
+    list_song_artists,
     list_streams,
-    update_stream_status,
-    upsert_parsed_songs,
+    update_song_texts,
+    update_streams_status,
 )
 
 console = Console()
@@ -35,7 +39,14 @@ CATEGORY_KEYWORDS: dict[str, list[str]] = {
     "3D/Dance": ["3D", "跳舞", "練舞"],
 }
 
+# Keywords lower-cased once, in definition order.
+_CATEGORY_KEYWORDS_LOWER: list[tuple[str, tuple[str, ...]]] = [
+    (category, tuple(kw.lower() for kw in keywords))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+]
+
 
+@lru_cache(maxsize=4096)
 def categorize_stream(title: str) -> str:
     """Classify a stream by its title keywords.
 
@@ -43,9 +54,9 @@ def categorize_stream(title: str) -> str:
     First match wins (categories are checked in definition order).
     """
     title_lower = title.lower()
-    for category, keywords in CATEGORY_KEYWORDS.items():
+    for category, keywords in _CATEGORY_KEYWORDS_LOWER:
         for kw in keywords:
-            if kw.lower() in title_lower:
+            if kw in title_lower:
                 return category
     return "Other"
 
@@ -55,27 +66,43 @@ def categorize_stream(title: str) -> str:
 # ---------------------------------------------------------------------------
 
 # Matches patterns like ✰:_MIZUKIMilk:, ✩:_SomeThing:, ✰□, etc.
-# Two-phase approach: strip emote codes first, then clean orphaned decorations.
-_NOISE_PATTERNS = [
-    re.compile(r"^\d+\.\s*(?=\D|$)"),      # setlist number prefix: "01. ", "1.Song", etc.
-    re.compile(r"[✰✩☆★]:_[^:]+:"),       # star + emote codes like ✰:_MIZUKIMilk:
-    re.compile(r"[✰✩☆★][□■]"),            # star + box artifacts
-    re.compile(r":_[A-Za-z0-9_]+:"),       # bare emote codes :_SomeThing:
-    re.compile(r"[✰✩☆★✿🍪🍮ʚɞ♡⃛]+"),    # leftover decorative chars (ʚ♡⃛ɞ, 🍪, ✿, etc.)
-]
+# All alternatives share one compiled pattern so each field is scanned once.
+# Emote codes are tried before the decorative class, and the class matches a
+# single char, so a star is only stripped on its own when it does not start
+# an emote code.
+_NOISE_RE = re.compile(
+    r"^\d+\.\s*(?=\D|$)"        # setlist number prefix: "01. ", "1.Song", etc.
+    r"|[✰✩☆★]:_[^:]+:"          # star + emote codes like ✰:_MIZUKIMilk:
+    r"|[✰✩☆★][□■]"               # star + box artifacts
+    r"|:_[A-Za-z0-9_]+:"          # bare emote codes :_SomeThing:
+    r"|[✰✩☆★✿🍪🍮ʚɞ♡⃛]"          # leftover decorative chars (ʚ♡⃛ɞ, 🍪, ✿, etc.)
+)
+
+_WS_RE = re.compile(r"\s{2,}")
+
+# Every non-prefix alternative of _NOISE_RE contains one of these chars, so a
+# text without them (and without a leading digit) cannot match.
+_NOISE_TRIGGERS = frozenset("✰✩☆★✿🍪🍮ʚɞ♡⃛:")
+
+
+# SQL counterpart of _may_have_noise for prefiltering rows in the cache.
+# Only ASCII and full-width digits are checked for the number prefix.
+_NOISE_GLOBS = (
+    f"*[{''.join(sorted(_NOISE_TRIGGERS))}]*",
+    "[0-9０-９]*",
+)
+
 
-# Backward-compatible aliases
-_EMOJI_PATTERNS = _NOISE_PATTERNS
+def _may_have_noise(text: str) -> bool:
+    """Cheap prefilter: False means _NOISE_RE cannot match *text*."""
+    return text[:1].isdecimal() or not _NOISE_TRIGGERS.isdisjoint(text)
 
 
 def _clean_text_field(text: str) -> str:
     """Remove noise artifacts (emoji/emote codes, number prefixes) from text."""
-    cleaned = text
-    for pat in _NOISE_PATTERNS:
-        cleaned = pat.sub("", cleaned)
+    cleaned = _NOISE_RE.sub("", text) if _may_have_noise(text) else text
     # Collapse multiple spaces and strip
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
-    return cleaned
+    return _WS_RE.sub(" ", cleaned).strip()
 
 
 # Keep backward-compatible alias used by tests
@@ -84,7 +111,7 @@ _clean_artist_field = _clean_text_field
 
 def _has_noise_artifacts(text: str) -> bool:
     """Return True if the text contains noise artifacts."""
-    return any(pat.search(text) for pat in _NOISE_PATTERNS)
+    return _may_have_noise(text) and _NOISE_RE.search(text) is not None
 
 
 # Backward-compatible alias
@@ -131,36 +158,31 @@ def generate_report(conn: sqlite3.Connection, *, detail: bool = False) -> None:
     console.print(status_tbl)
 
     # --- Category breakdown for extracted streams ---
-    extracted = list_streams(conn, status="extracted")
+    extracted = get_report_aggregates(conn, status="extracted")
     if not extracted:
         console.print("\n[dim]No extracted streams to analyze.[/dim]")
         return
 
     cat_counts: dict[str, int] = {}
     cat_songs: dict[str, int] = {}
-    cat_streams: dict[str, list[sqlite3.Row]] = {}
+    stream_cats: list[str] = []
     total_songs = 0
     songs_with_artist = 0
-    songs_with_emoji = 0
 
     for stream in extracted:
         cat = categorize_stream(stream["title"] or "")
+        stream_cats.append(cat)
         cat_counts[cat] = cat_counts.get(cat, 0) + 1
-        if cat not in cat_streams:
-            cat_streams[cat] = []
-        cat_streams[cat].append(stream)
 
-        songs = get_parsed_songs(conn, stream["video_id"])
-        song_count = len(songs)
+        song_count = stream["song_count"]
         cat_songs[cat] = cat_songs.get(cat, 0) + song_count
         total_songs += song_count
+        songs_with_artist += stream["artist_count"]
 
-        for song in songs:
-            artist = song["artist"] or ""
-            if artist.strip():
-                songs_with_artist += 1
-            if _has_noise_artifacts(artist):
-                songs_with_emoji += 1
+    songs_with_emoji = sum(
+        1 for artist in list_song_artists(conn, status="extracted")
+        if _has_noise_artifacts(artist)
+    )
 
     console.print()
     cat_tbl = Table(
@@ -213,11 +235,9 @@ def generate_report(conn: sqlite3.Connection, *, detail: bool = False) -> None:
         detail_tbl.add_column("Songs", justify="right")
         detail_tbl.add_column("Quality", justify="right")
 
-        for stream in extracted:
-            cat = categorize_stream(stream["title"] or "")
-            songs = get_parsed_songs(conn, stream["video_id"])
-            song_count = len(songs)
-            with_artist = sum(1 for s in songs if (s["artist"] or "").strip())
+        for stream, cat in zip(extracted, stream_cats):
+            song_count = stream["song_count"]
+            with_artist = stream["artist_count"]
             quality = f"{with_artist}/{song_count}" if song_count else "—"
             detail_tbl.add_row(
                 stream["video_id"],
@@ -303,10 +323,7 @@ def batch_approve(
             console.print("[dim]Cancelled.[/dim]")
             return 0
 
-    count = 0
-    for s in targets:
-        update_stream_status(conn, s["video_id"], "approved")
-        count += 1
+    count = update_streams_status(conn, [s["video_id"] for s in targets], "approved")
 
     console.print(f"[green]Approved {count} streams.[/green]")
     return count
@@ -380,10 +397,7 @@ def batch_exclude(
             console.print("[dim]Cancelled.[/dim]")
             return 0
 
-    count = 0
-    for s in targets:
-        update_stream_status(conn, s["video_id"], "excluded")
-        count += 1
+    count = update_streams_status(conn, [s["video_id"] for s in targets], "excluded")
 
     console.print(f"[red]Excluded {count} streams.[/red]")
     return count
@@ -402,65 +416,44 @@ def clean_parsed_songs(
 
     Returns the count of songs cleaned (or that would be cleaned in dry-run).
     """
-    all_streams = list_streams(conn)
     cleaned_total = 0
-
-    for stream in all_streams:
-        songs = get_parsed_songs(conn, stream["video_id"])
-        if not songs:
-            continue
-
-        dirty = []
-        for song in songs:
-            artist = song["artist"] or ""
-            song_name = song["song_name"] or ""
-            if _has_noise_artifacts(artist) or _has_noise_artifacts(song_name):
-                dirty.append(song)
-
-        if not dirty:
+    updates: list[tuple[int, str, str | None]] = []
+
+    # The GLOB prefilter over-approximates; the regex decides per field.
+    for song in find_parsed_songs_glob(conn, _NOISE_GLOBS):
+        artist = song["artist"] or ""
+        song_name = song["song_name"] or ""
+        artist_dirty = _has_noise_artifacts(artist)
+        name_dirty = _has_noise_artifacts(song_name)
+        if not (artist_dirty or name_dirty):
             continue
+        cleaned_total += 1
 
         if dry_run:
-            for song in dirty:
-                artist = song["artist"] or ""
-                song_name = song["song_name"] or ""
-                if _has_noise_artifacts(artist):
-                    console.print(
-                        f"  [cyan]{stream['video_id']}[/cyan] #{song['order_index']} artist: "
-                        f"[red]{artist!r}[/red] → [green]{_clean_text_field(artist)!r}[/green]"
-                    )
-                if _has_noise_artifacts(song_name):
-                    console.print(
-                        f"  [cyan]{stream['video_id']}[/cyan] #{song['order_index']} song_name: "
-                        f"[red]{song_name!r}[/red] → [green]{_clean_text_field(song_name)!r}[/green]"
-                    )
-            cleaned_total += len(dirty)
+            if artist_dirty:
+                console.print(
+                    f"  [cyan]{song['video_id']}[/cyan] #{song['order_index']} artist: "
+                    f"[red]{artist!r}[/red] → [green]{_clean_text_field(artist)!r}[/green]"
+                )
+            if name_dirty:
+                console.print(
+                    f"  [cyan]{song['video_id']}[/cyan] #{song['order_index']} song_name: "
+                    f"[red]{song_name!r}[/red] → [green]{_clean_text_field(song_name)!r}[/green]"
+                )
             continue
 
-        # Rebuild the full song list with cleaned fields
-        updated_songs = []
-        for song in songs:
-            artist = song["artist"] or ""
-            song_name = song["song_name"] or ""
-            song_dirty = False
-            if _has_noise_artifacts(artist):
-                artist = _clean_text_field(artist)
-                song_dirty = True
-            if _has_noise_artifacts(song_name):
-                song_name = _clean_text_field(song_name)
-                song_dirty = True
-            if song_dirty:
-                cleaned_total += 1
-            updated_songs.append({
-                "order_index": song["order_index"],
-                "song_name": song_name if song_name else song["song_name"],
-                "artist": artist if artist else None,
-                "start_timestamp": song["start_timestamp"],
-                "end_timestamp": song["end_timestamp"],
-                "note": song["note"],
-            })
-
-        upsert_parsed_songs(conn, stream["video_id"], updated_songs)
+        if artist_dirty:
+            artist = _clean_text_field(artist)
+        if name_dirty:
+            song_name = _clean_text_field(song_name)
+        updates.append((
+            song["id"],
+            song_name if song_name else song["song_name"],
+            artist if artist else None,
+        ))
+
+    if updates:
+        update_song_texts(conn, updates)
 
     if dry_run:
         console.print(f"\n[yellow]Dry run — {cleaned_total} songs would be cleaned.[/yellow]")
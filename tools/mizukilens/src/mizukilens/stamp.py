@@ -6,9 +6,18 @@ flows through the normal export → import pipeline to reach songs.json.
 
 from __future__ import annotations
 
+import queue
+import sqlite3
+import threading
+import time
 from pathlib import Path
 
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
+
+# How long /api/streams and /api/stats answers are reused.  Writes made
+# through this app invalidate them at once; the TTL only bounds how long
+# changes from other processes (e.g. the CLI) take to show up.
+READ_CACHE_TTL = 2.0
 
 
 def create_app(db_path: str | Path | None = None) -> Flask:
@@ -27,9 +36,55 @@ def create_app(db_path: str | Path | None = None) -> Flask:
     # Store db_path in app config so routes can access it.
     app.config["DB_PATH"] = db_path
 
-    def _open():
-        from mizukilens.cache import open_db
-        return open_db(app.config["DB_PATH"])
+    # Idle connections shared across requests.  The dev server handles each
+    # request on a fresh thread, so a thread-local would never be reused;
+    # a pool lets each request skip the connect + schema setup of open_db.
+    pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+
+    def _open() -> sqlite3.Connection:
+        """Return this request's connection, taking one from the pool if idle."""
+        if "db" not in g:
+            try:
+                g.db = pool.get_nowait()
+            except queue.Empty:
+                from mizukilens.cache import open_db
+                g.db = open_db(app.config["DB_PATH"], check_same_thread=False)
+        return g.db
+
+    @app.teardown_appcontext
+    def _release_db(exc: BaseException | None) -> None:
+        conn = g.pop("db", None)
+        if conn is not None:
+            conn.rollback()  # never hand on an open transaction
+            pool.put(conn)
+
+    # Cached payloads of the polled read endpoints: key -> (expires, payload).
+    # Writes bump read_cache_gen; a payload computed under an older
+    # generation may hold pre-write data and is returned but not stored.
+    read_cache: dict[tuple, tuple[float, object]] = {}
+    read_cache_lock = threading.Lock()
+    read_cache_gen = 0
+
+    def _cached(key: tuple, compute):
+        with read_cache_lock:
+            gen = read_cache_gen
+            hit = read_cache.get(key)
+        if hit is not None and time.monotonic() < hit[0]:
+            return hit[1]
+        payload = compute()
+        with read_cache_lock:
+            if gen == read_cache_gen:
+                read_cache[key] = (time.monotonic() + READ_CACHE_TTL, payload)
+        return payload
+
+    @app.teardown_request
+    def _invalidate_read_cache(exc: BaseException | None) -> None:
+        # Runs after the handler has committed, even when it raised.
+        nonlocal read_cache_gen
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+            with read_cache_lock:
+                read_cache_gen += 1
+                read_cache.clear()
 
     # ------------------------------------------------------------------
     # Page
@@ -61,8 +116,8 @@ def create_app(db_path: str | Path | None = None) -> Flask:
         if not statuses:
             return jsonify([])
 
-        conn = _open()
-        try:
+        def _query() -> list[dict]:
+            conn = _open()
             placeholders = ",".join("?" for _ in statuses)
             cur = conn.execute(
                 "SELECT s.video_id, s.title, s.date, s.status, "
@@ -73,8 +128,7 @@ def create_app(db_path: str | Path | None = None) -> Flask:
                 "ORDER BY s.date DESC, s.video_id",
                 tuple(statuses),
             )
-            rows = cur.fetchall()
-            return jsonify([
+            return [
                 {
                     "videoId": r["video_id"],
                     "title": r["title"],
@@ -82,10 +136,10 @@ def create_app(db_path: str | Path | None = None) -> Flask:
                     "status": r["status"],
                     "pending": r["pending"],
                 }
-                for r in rows
-            ])
-        finally:
-            conn.close()
+                for r in cur.fetchall()
+            ]
+
+        return jsonify(_cached(("streams", *sorted(statuses)), _query))
 
     # ------------------------------------------------------------------
     # API: songs for a stream
@@ -95,30 +149,27 @@ def create_app(db_path: str | Path | None = None) -> Flask:
     def api_stream_songs(video_id: str):
         """Return parsed songs for a stream, sorted by order_index."""
         conn = _open()
-        try:
-            cur = conn.execute(
-                "SELECT id, order_index, song_name, artist, "
-                "       start_timestamp, end_timestamp, note, manual_end_ts, duration "
-                "FROM parsed_songs WHERE video_id = ? ORDER BY order_index",
-                (video_id,),
-            )
-            rows = cur.fetchall()
-            return jsonify([
-                {
-                    "id": r["id"],
-                    "orderIndex": r["order_index"],
-                    "songName": r["song_name"],
-                    "artist": r["artist"],
-                    "startTimestamp": r["start_timestamp"],
-                    "endTimestamp": r["end_timestamp"],
-                    "note": r["note"],
-                    "manualEndTs": bool(r["manual_end_ts"]),
-                    "duration": r["duration"],
-                }
-                for r in rows
-            ])
-        finally:
-            conn.close()
+        cur = conn.execute(
+            "SELECT id, order_index, song_name, artist, "
+            "       start_timestamp, end_timestamp, note, manual_end_ts, duration "
+            "FROM parsed_songs WHERE video_id = ? ORDER BY order_index",
+            (video_id,),
+        )
+        rows = cur.fetchall()
+        return jsonify([
+            {
+                "id": r["id"],
+                "orderIndex": r["order_index"],
+                "songName": r["song_name"],
+                "artist": r["artist"],
+                "startTimestamp": r["start_timestamp"],
+                "endTimestamp": r["end_timestamp"],
+                "note": r["note"],
+                "manualEndTs": bool(r["manual_end_ts"]),
+                "duration": r["duration"],
+            }
+            for r in rows
+        ])
 
     # ------------------------------------------------------------------
     # API: set end timestamp
@@ -138,16 +189,13 @@ def create_app(db_path: str | Path | None = None) -> Flask:
             return jsonify({"error": "endTimestamp must be a non-empty string"}), 400
 
         conn = _open()
-        try:
-            updated = update_song_end_timestamp(
-                conn, song_pk, end_ts.strip(), manual=True
-            )
-            if not updated:
-                return jsonify({"error": f"Song {song_pk} not found"}), 404
-            _maybe_reapprove_stream(conn, song_pk)
-            return jsonify({"ok": True, "songId": song_pk, "endTimestamp": end_ts.strip()})
-        finally:
-            conn.close()
+        updated = update_song_end_timestamp(
+            conn, song_pk, end_ts.strip(), manual=True
+        )
+        if not updated:
+            return jsonify({"error": f"Song {song_pk} not found"}), 404
+        _maybe_reapprove_stream(conn, song_pk)
+        return jsonify({"ok": True, "songId": song_pk, "endTimestamp": end_ts.strip()})
 
     # ------------------------------------------------------------------
     # API: set start timestamp
@@ -167,14 +215,11 @@ def create_app(db_path: str | Path | None = None) -> Flask:
             return jsonify({"error": "startTimestamp must be a non-empty string"}), 400
 
         conn = _open()
-        try:
-            updated = update_song_start_timestamp(conn, song_pk, start_ts.strip())
-            if not updated:
-                return jsonify({"error": f"Song {song_pk} not found"}), 404
-            _maybe_reapprove_stream(conn, song_pk)
-            return jsonify({"ok": True, "songId": song_pk, "startTimestamp": start_ts.strip()})
-        finally:
-            conn.close()
+        updated = update_song_start_timestamp(conn, song_pk, start_ts.strip())
+        if not updated:
+            return jsonify({"error": f"Song {song_pk} not found"}), 404
+        _maybe_reapprove_stream(conn, song_pk)
+        return jsonify({"ok": True, "songId": song_pk, "startTimestamp": start_ts.strip()})
 
     # ------------------------------------------------------------------
     # API: clear end timestamp
@@ -186,14 +231,11 @@ def create_app(db_path: str | Path | None = None) -> Flask:
         from mizukilens.cache import clear_song_end_timestamp
 
         conn = _open()
-        try:
-            updated = clear_song_end_timestamp(conn, song_pk)
-            if not updated:
-                return jsonify({"error": f"Song {song_pk} not found"}), 404
-            _maybe_reapprove_stream(conn, song_pk)
-            return jsonify({"ok": True, "songId": song_pk})
-        finally:
-            conn.close()
+        updated = clear_song_end_timestamp(conn, song_pk)
+        if not updated:
+            return jsonify({"error": f"Song {song_pk} not found"}), 404
+        _maybe_reapprove_stream(conn, song_pk)
+        return jsonify({"ok": True, "songId": song_pk})
 
     # ------------------------------------------------------------------
     # API: update song details (name / artist)
@@ -226,34 +268,31 @@ def create_app(db_path: str | Path | None = None) -> Flask:
             artist = artist.strip() if artist else None
 
         conn = _open()
-        try:
-            from mizukilens.cache import _SENTINEL
-            kwargs: dict = {}
-            if song_name is not None:
-                kwargs["song_name"] = song_name
-            if artist_provided:
-                kwargs["artist"] = artist
-            else:
-                kwargs["artist"] = _SENTINEL
-
-            updated = update_song_details(conn, song_pk, **kwargs)
-            if not updated:
-                return jsonify({"error": f"Song {song_pk} not found"}), 404
-            _maybe_reapprove_stream(conn, song_pk)
+        from mizukilens.cache import _SENTINEL
+        kwargs: dict = {}
+        if song_name is not None:
+            kwargs["song_name"] = song_name
+        if artist_provided:
+            kwargs["artist"] = artist
+        else:
+            kwargs["artist"] = _SENTINEL
 
-            # Read back the updated row
-            row = conn.execute(
-                "SELECT song_name, artist FROM parsed_songs WHERE id = ?",
-                (song_pk,),
-            ).fetchone()
-            return jsonify({
-                "ok": True,
-                "songId": song_pk,
-                "songName": row["song_name"],
-                "artist": row["artist"],
-            })
-        finally:
-            conn.close()
+        updated = update_song_details(conn, song_pk, **kwargs)
+        if not updated:
+            return jsonify({"error": f"Song {song_pk} not found"}), 404
+        _maybe_reapprove_stream(conn, song_pk)
+
+        # Read back the updated row
+        row = conn.execute(
+            "SELECT song_name, artist FROM parsed_songs WHERE id = ?",
+            (song_pk,),
+        ).fetchone()
+        return jsonify({
+            "ok": True,
+            "songId": song_pk,
+            "songName": row["song_name"],
+            "artist": row["artist"],
+        })
 
     # ------------------------------------------------------------------
     # API: fetch song duration from iTunes
@@ -297,8 +336,6 @@ def create_app(db_path: str | Path | None = None) -> Flask:
             return jsonify({"ok": True, "duration": duration, "end_timestamp": end_ts})
         except Exception as exc:
             return jsonify({"error": str(exc)}), 502
-        finally:
-            conn.close()
 
     # ------------------------------------------------------------------
     # API: progress stats
@@ -307,8 +344,8 @@ def create_app(db_path: str | Path | None = None) -> Flask:
     @app.route("/api/stats")
     def api_stats():
         """Return stamp progress: total / filled / remaining."""
-        conn = _open()
-        try:
+        def _query() -> dict:
+            conn = _open()
             cur = conn.execute(
                 "SELECT COUNT(*) as total, "
                 "  SUM(CASE WHEN end_timestamp IS NOT NULL THEN 1 ELSE 0 END) as filled "
@@ -319,13 +356,13 @@ def create_app(db_path: str | Path | None = None) -> Flask:
             row = cur.fetchone()
             total = row["total"]
             filled = row["filled"]
-            return jsonify({
+            return {
                 "total": total,
                 "filled": filled,
                 "remaining": total - filled,
-            })
-        finally:
-            conn.close()
+            }
+
+        return jsonify(_cached(("stats",), _query))
 
     # ------------------------------------------------------------------
     # API: delete a song
@@ -337,14 +374,11 @@ def create_app(db_path: str | Path | None = None) -> Flask:
         from mizukilens.cache import delete_parsed_song
 
         conn = _open()
-        try:
-            video_id = delete_parsed_song(conn, song_pk)
-            if video_id is None:
-                return jsonify({"error": f"Song {song_pk} not found"}), 404
-            _maybe_reapprove_stream_by_video_id(conn, video_id)
-            return jsonify({"ok": True, "songId": song_pk})
-        finally:
-            conn.close()
+        video_id = delete_parsed_song(conn, song_pk)
+        if video_id is None:
+            return jsonify({"error": f"Song {song_pk} not found"}), 404
+        _maybe_reapprove_stream_by_video_id(conn, video_id)
+        return jsonify({"ok": True, "songId": song_pk})
 
     # ------------------------------------------------------------------
     # API: refetch/re-extract stream timestamps
@@ -357,20 +391,17 @@ def create_app(db_path: str | Path | None = None) -> Flask:
         from mizukilens.extraction import extract_timestamps
 
         conn = _open()
-        try:
-            stream = get_stream(conn, video_id)
-            if not stream:
-                return jsonify({"error": f"Stream {video_id} not found"}), 404
-
-            result = extract_timestamps(conn, video_id)
-            return jsonify({
-                "ok": True,
-                "source": result.source,
-                "songCount": len(result.songs),
-                "status": result.status,
-            })
-        finally:
-            conn.close()
+        stream = get_stream(conn, video_id)
+        if not stream:
+            return jsonify({"error": f"Stream {video_id} not found"}), 404
+
+        result = extract_timestamps(conn, video_id)
+        return jsonify({
+            "ok": True,
+            "source": result.source,
+            "songCount": len(result.songs),
+            "status": result.status,
+        })
 
     # ------------------------------------------------------------------
     # API: clear all end timestamps for a stream
@@ -382,15 +413,12 @@ def create_app(db_path: str | Path | None = None) -> Flask:
         from mizukilens.cache import clear_all_end_timestamps, get_stream
 
         conn = _open()
-        try:
-            stream = get_stream(conn, video_id)
-            if not stream:
-                return jsonify({"error": f"Stream {video_id} not found"}), 404
-            cleared = clear_all_end_timestamps(conn, video_id)
-            _maybe_reapprove_stream_by_video_id(conn, video_id)
-            return jsonify({"ok": True, "cleared": cleared})
-        finally:
-            conn.close()
+        stream = get_stream(conn, video_id)
+        if not stream:
+            return jsonify({"error": f"Stream {video_id} not found"}), 404
+        cleared = clear_all_end_timestamps(conn, video_id)
+        _maybe_reapprove_stream_by_video_id(conn, video_id)
+        return jsonify({"ok": True, "cleared": cleared})
 
     # ------------------------------------------------------------------
     # Helper: re-approve stream after stamp edit
@@ -398,11 +426,11 @@ def create_app(db_path: str | Path | None = None) -> Flask:
 
     def _maybe_reapprove_stream_by_video_id(conn, video_id: str) -> None:
         """Transition a stream to 'approved' after stamp edits."""
-        from mizukilens.cache import get_stream, update_stream_status
+        from mizukilens.cache import update_streams_status
 
-        stream = get_stream(conn, video_id)
-        if stream and stream["status"] in ("extracted", "pending", "exported", "imported"):
-            update_stream_status(conn, video_id, "approved")
+        # Only statuses that may move to 'approved' (extracted, pending,
+        # exported, imported) are touched, in a single guarded UPDATE.
+        update_streams_status(conn, [video_id], "approved")
 
     def _maybe_reapprove_stream(conn, song_pk: int) -> None:
         """Transition the song's parent stream back to 'approved' if needed."""
@@ -18,21 +18,27 @@ from mizukilens.cache import (
     clear_candidates,
     clear_stream,
     delete_stream,
+    find_parsed_songs_glob,
     get_candidate_comment,
     get_db_path,
     get_parsed_songs,
+    get_parsed_songs_for_streams,
+    get_report_aggregates,
     get_songs_missing_end_timestamp,
     get_status_counts,
     get_stream,
     is_valid_transition,
     list_candidate_comments,
+    list_song_artists,
     list_streams,
+    mark_streams_imported,
     open_db,
     save_candidate_comments,
     update_candidate_status,
     update_song_end_timestamp,
     update_stream_date,
     update_stream_status,
+    update_streams_status,
     upsert_parsed_songs,
     upsert_stream,
 )
@@ -135,6 +141,21 @@ class TestDatabaseCreation:
         c2 = open_db(db_path)
         c2.close()
 
+    def test_open_db_uses_wal_with_normal_sync(self, db: sqlite3.Connection) -> None:
+        """WAL + synchronous=NORMAL avoids an fsync on every commit."""
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_pending_end_timestamp_queries_use_partial_index(self, db: sqlite3.Connection) -> None:
+        plan = " ".join(
+            row[3] for row in db.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM parsed_songs "
+                "WHERE video_id = ? AND end_timestamp IS NULL",
+                ("x",),
+            )
+        )
+        assert "idx_parsed_songs_pending_end" in plan
+
     def test_get_db_path_default(self) -> None:
         """With no override, get_db_path should return a path under ~/.local/share."""
         # load_config is imported inside _resolve_cache_path so patch from the config module
@@ -332,6 +353,32 @@ class TestStatusTransitions:
         update_stream_status(db, "pend", "pending")
         assert get_stream(db, "pend")["status"] == "pending"
 
+    def test_mark_streams_imported(self, db: sqlite3.Connection) -> None:
+        """exported/approved move to imported in one call; others untouched."""
+        _add_stream(db, "exp", status="exported")
+        _add_stream(db, "appr", status="approved")
+        _add_stream(db, "pend", status="pending")
+        count = mark_streams_imported(db, ["exp", "appr", "pend", "ghost"])
+        assert count == 2
+        assert get_stream(db, "exp")["status"] == "imported"
+        assert get_stream(db, "appr")["status"] == "imported"
+        assert get_stream(db, "pend")["status"] == "pending"
+
+    def test_update_streams_status_batch(self, db: sqlite3.Connection) -> None:
+        """Legal transitions apply in one call; missing/illegal ones are skipped."""
+        _add_stream(db, "ext", status="extracted")
+        _add_stream(db, "imp", status="imported")
+        _add_stream(db, "disc", status="discovered")
+        count = update_streams_status(db, ["ext", "imp", "disc", "ghost"], "approved")
+        assert count == 2
+        assert get_stream(db, "ext")["status"] == "approved"
+        assert get_stream(db, "imp")["status"] == "approved"
+        assert get_stream(db, "disc")["status"] == "discovered"
+
+    def test_update_streams_status_invalid_status(self, db: sqlite3.Connection) -> None:
+        with pytest.raises(ValueError):
+            update_streams_status(db, ["x"], "bogus")
+
     def test_all_statuses_listed_in_valid_statuses(self) -> None:
         expected = {
             "discovered", "extracted", "pending",
@@ -426,6 +473,56 @@ class TestParsedSongsCRUD:
         rows = get_parsed_songs(db, "no_such_vid")
         assert rows == []
 
+    def test_get_parsed_songs_for_streams_groups_in_order(self, db: sqlite3.Connection) -> None:
+        _add_stream(db, "psb")
+        _add_stream(db, "psa")
+        upsert_parsed_songs(db, "psb", list(reversed(self._sample_songs())))
+        upsert_parsed_songs(db, "psa", self._sample_songs()[:1])
+        grouped = get_parsed_songs_for_streams(db, ["psb", "psa", "none"])
+        assert list(grouped) == ["psb", "psa", "none"]
+        assert [r["order_index"] for r in grouped["psb"]] == [0, 1]
+        assert [r["song_name"] for r in grouped["psa"]] == ["打上花火"]
+        assert grouped["none"] == []
+
+    def test_find_parsed_songs_glob(self, db: sqlite3.Connection) -> None:
+        _add_stream(db, "g_old", date="2024-01-01")
+        _add_stream(db, "g_new", date="2024-06-01")
+        upsert_parsed_songs(db, "g_old", [
+            {"order_index": 0, "song_name": "Plain", "artist": "✰ A", "start_timestamp": "0:00"},
+            {"order_index": 1, "song_name": "Plain", "artist": None, "start_timestamp": "1:00"},
+        ])
+        upsert_parsed_songs(db, "g_new", [
+            {"order_index": 0, "song_name": "01. Song", "artist": None, "start_timestamp": "0:00"},
+        ])
+        rows = find_parsed_songs_glob(db, ["*✰*", "[0-9]*"])
+        assert [(r["video_id"], r["order_index"]) for r in rows] == [("g_new", 0), ("g_old", 0)]
+        assert find_parsed_songs_glob(db, []) == []
+
+    def test_get_parsed_songs_for_streams_empty_input(self, db: sqlite3.Connection) -> None:
+        assert get_parsed_songs_for_streams(db, []) == {}
+
+    def test_get_parsed_songs_for_streams_spans_chunks(self, db: sqlite3.Connection) -> None:
+        ids = [f"chunk{i:04d}" for i in range(1200)]
+        for vid in ids[::100]:
+            _add_stream(db, vid)
+            upsert_parsed_songs(db, vid, self._sample_songs())
+        grouped = get_parsed_songs_for_streams(db, ids)
+        assert len(grouped) == 1200
+        assert sum(len(rows) for rows in grouped.values()) == 24
+        assert len(grouped["chunk1100"]) == 2
+
+    def test_query_in_chunks_splits_ids(self, db: sqlite3.Connection) -> None:
+        from mizukilens.cache import _query_in_chunks
+
+        _add_stream(db, "q1")
+        _add_stream(db, "q2")
+        _add_stream(db, "q3")
+        rows = list(_query_in_chunks(
+            db, "SELECT video_id FROM streams WHERE video_id IN ({placeholders})",
+            ["q1", "q2", "q3", "missing"], chunk_size=2,
+        ))
+        assert sorted(r["video_id"] for r in rows) == ["q1", "q2", "q3"]
+
 
 # ===========================================================================
 # SECTION 5: Status statistics
@@ -449,6 +546,26 @@ class TestStatusCounts:
         assert counts["extracted"] == 1
         assert counts["approved"] == 0
 
+    def test_report_aggregates_per_stream(self, db: sqlite3.Connection) -> None:
+        _add_stream(db, "ra1", status="extracted", date="2024-01-01")
+        _add_stream(db, "ra2", status="extracted", date="2024-02-01")
+        _add_stream(db, "ra3", status="approved")
+        upsert_parsed_songs(db, "ra1", [
+            {"order_index": i, "song_name": f"S{i}", "artist": artist,
+             "start_timestamp": "0:00"}
+            for i, artist in enumerate(["A", None, "  ", "\u3000", " B ", "\u00a0", "\u2009"])
+        ])
+        upsert_parsed_songs(db, "ra3", [
+            {"order_index": 0, "song_name": "X", "artist": "C", "start_timestamp": "0:00"},
+        ])
+        rows = get_report_aggregates(db)
+        assert [r["video_id"] for r in rows] == ["ra2", "ra1"]
+        by_id = {r["video_id"]: r for r in rows}
+        assert (by_id["ra1"]["song_count"], by_id["ra1"]["artist_count"]) == (7, 2)
+        assert (by_id["ra2"]["song_count"], by_id["ra2"]["artist_count"]) == (0, 0)
+        assert sorted(list_song_artists(db)) == ["  ", " B ", "A", "\u00a0", "\u2009", "\u3000"]
+        assert list_song_artists(db, status="approved") == ["C"]
+
 
 # ===========================================================================
 # SECTION 6: Cache clear operations
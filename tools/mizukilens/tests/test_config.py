@@ -12,8 +12,10 @@ import pytest
 
 from mizukilens.config import (
     CONFIG_PATH,
+    DEFAULT_EXPORT_FETCH_BATCH,
     DEFAULT_KEYWORDS,
     _default_config,
+    get_export_fetch_batch,
     is_valid_input,
     load_config,
     parse_channel_input,
@@ -159,3 +161,33 @@ class TestDefaultConfig:
         assert set(cfg["channels"]["mizuki"]["keywords"]) == set(DEFAULT_KEYWORDS)
         assert "cache" in cfg
         assert "export" in cfg
+
+
+# ---------------------------------------------------------------------------
+# get_export_fetch_batch
+# ---------------------------------------------------------------------------
+
+class TestExportFetchBatch:
+    """Tests for the [export] fetch_batch setting."""
+
+    def test_default_when_no_config(self, tmp_path: Path) -> None:
+        with patch("mizukilens.config.CONFIG_PATH", tmp_path / "missing.toml"):
+            assert get_export_fetch_batch() == DEFAULT_EXPORT_FETCH_BATCH == 1000
+
+    def test_configured_value(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.toml"
+        with (
+            patch("mizukilens.config.CONFIG_PATH", config_file),
+            patch("mizukilens.config.CONFIG_DIR", tmp_path),
+        ):
+            save_config({"export": {"fetch_batch": 250}})
+            assert get_export_fetch_batch() == 250
+
+    def test_invalid_value_falls_back_to_default(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.toml"
+        with (
+            patch("mizukilens.config.CONFIG_PATH", config_file),
+            patch("mizukilens.config.CONFIG_DIR", tmp_path),
+        ):
+            save_config({"export": {"fetch_batch": 0}})
+            assert get_export_fetch_batch() == DEFAULT_EXPORT_FETCH_BATCH
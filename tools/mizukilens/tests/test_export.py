@@ -921,3 +921,149 @@ class TestCommentCreditExport:
         assert credit["author"] == "SomeUser"
         assert "authorUrl" not in credit
         assert "commentUrl" not in credit
+
+
+class TestBuildStreamEntities:
+    """Stream entities are assembled in SQLite via the JSON1 functions."""
+
+    def test_preserves_requested_order_and_key_order(self, db: sqlite3.Connection) -> None:
+        from mizukilens.export import _build_stream_entities
+
+        _add_approved_stream(db, video_id="aaa", title="A", date="2024-01-01")
+        _add_approved_stream(db, video_id="bbb", title="B", date="2024-02-01")
+        entities = _build_stream_entities(db, ["bbb", "aaa"])
+        assert [e["id"] for e in entities] == ["bbb", "aaa"]
+        assert list(entities[0]) == ["id", "youtubeUrl", "date", "title"]
+        assert entities[0]["youtubeUrl"] == _youtube_url("bbb")
+
+    def test_empty_comment_author_yields_no_credit(self, db: sqlite3.Connection) -> None:
+        from mizukilens.export import _build_stream_entities
+
+        upsert_stream(
+            db, video_id="empty01", channel_id="UCtest", title="t", date="2024-01-01",
+            status="approved", comment_author="", comment_id="Ugx",
+        )
+        (entity,) = _build_stream_entities(db, ["empty01"])
+        assert "commentCredit" not in entity
+
+    def test_empty_author_url_and_comment_id_are_omitted(self, db: sqlite3.Connection) -> None:
+        from mizukilens.export import _build_stream_entities
+
+        upsert_stream(
+            db, video_id="empty02", channel_id="UCtest", title="t", date="2024-01-01",
+            status="approved", comment_author="Hero", comment_author_url="", comment_id="",
+        )
+        (entity,) = _build_stream_entities(db, ["empty02"])
+        assert entity["commentCredit"] == {"author": "Hero"}
+
+    def test_empty_id_list(self, db: sqlite3.Connection) -> None:
+        from mizukilens.export import _build_stream_entities
+
+        assert _build_stream_entities(db, []) == []
+
+
+class TestTimestampFormatting:
+    """exportedAt and the filename are derived without strftime."""
+
+    def test_exported_at_matches_strftime(self) -> None:
+        from mizukilens.export import _iso_seconds
+
+        now = datetime(2024, 3, 5, 4, 3, 2, 123456, tzinfo=timezone.utc)
+        assert _iso_seconds(now) + "Z" == now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def test_filename_matches_strftime(self) -> None:
+        from mizukilens.export import _export_filename
+
+        now = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+        assert _export_filename(now) == "mizukilens-export-2024-12-31-235959.json"
+
+
+class TestStreamingWriter:
+    """write_export_streaming produces the same document as the dict builder."""
+
+    def test_matches_build_export_payload(self, db: sqlite3.Connection, tmp_path: Path) -> None:
+        from mizukilens.export import write_export_streaming
+
+        upsert_stream(
+            db, video_id="s1", channel_id="UCtest", title="歌回", date="2024-03-16",
+            status="approved", comment_author="Hero", comment_id="Ugx",
+        )
+        upsert_parsed_songs(db, "s1", [_SONG_A, _SONG_B])
+        _add_approved_stream(db, video_id="s2", date="2024-03-15", songs=[_SONG_A])
+        _add_approved_stream(db, video_id="s3", date="2024-03-14")
+
+        now = datetime(2024, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        out = tmp_path / "out.json"
+        counts = write_export_streaming(
+            db, out, video_ids=["s1", "s2", "s3"], channel_id="UCtest", now=now
+        )
+        written = json.loads(out.read_text(encoding="utf-8"))
+        expected = build_export_payload(
+            db,
+            streams=[get_stream(db, v) for v in ("s1", "s2", "s3")],
+            channel_id="UCtest",
+            now=now,
+        )
+
+        assert counts == (3, 2, 3)
+        assert {k: v for k, v in written.items() if k != "data"} == {
+            k: v for k, v in expected.items() if k != "data"
+        }
+        assert written["data"]["streams"] == expected["data"]["streams"]
+        # IDs are random; compare everything else.
+        strip = lambda items: [{k: v for k, v in i.items() if k not in ("id", "songId")} for i in items]  # noqa: E731
+        assert strip(written["data"]["songs"]) == strip(expected["data"]["songs"])
+        assert strip(written["data"]["versions"]) == strip(expected["data"]["versions"])
+        song_ids = {s["id"] for s in written["data"]["songs"]}
+        assert all(v["songId"] in song_ids for v in written["data"]["versions"])
+
+    def test_empty_arrays(self, db: sqlite3.Connection, tmp_path: Path) -> None:
+        from mizukilens.export import write_export_streaming
+
+        _add_approved_stream(db, video_id="s1")
+        out = tmp_path / "out.json"
+        counts = write_export_streaming(
+            db, out, video_ids=["s1"], channel_id="UCtest",
+            now=datetime(2024, 3, 20, tzinfo=timezone.utc),
+        )
+        data = json.loads(out.read_text(encoding="utf-8"))["data"]
+        assert counts == (1, 0, 0)
+        assert data["songs"] == [] and data["versions"] == []
+
+
+class TestConfigCaching:
+    """Config-derived export settings are read from disk only once."""
+
+    def test_default_output_dir_reads_config_once(self, tmp_path: Path) -> None:
+        from mizukilens.export import _default_output_dir, _resolve_output_dir
+
+        cfg = {"export": {"output_dir": str(tmp_path / "exports")}}
+        _default_output_dir.cache_clear()
+        try:
+            with patch("mizukilens.config.load_config", return_value=cfg) as mock_load:
+                first = _resolve_output_dir(None)
+                second = _resolve_output_dir(None)
+            assert first == second == (tmp_path / "exports").resolve()
+            assert mock_load.call_count == 1
+        finally:
+            _default_output_dir.cache_clear()
+
+    def test_fetch_batch_survives_malformed_config(self, tmp_path: Path) -> None:
+        from mizukilens.config import DEFAULT_EXPORT_FETCH_BATCH
+        from mizukilens.export import _fetch_batch
+
+        bad = tmp_path / "config.toml"
+        bad.write_text("[export\nfetch_batch = ", encoding="utf-8")
+        _fetch_batch.cache_clear()
+        try:
+            with patch("mizukilens.config.CONFIG_PATH", bad):
+                assert _fetch_batch() == DEFAULT_EXPORT_FETCH_BATCH
+        finally:
+            _fetch_batch.cache_clear()
+
+    def test_explicit_output_dir_skips_config(self, tmp_path: Path) -> None:
+        from mizukilens.export import _resolve_output_dir
+
+        with patch("mizukilens.config.load_config") as mock_load:
+            assert _resolve_output_dir(tmp_path) == tmp_path.resolve()
+        mock_load.assert_not_called()
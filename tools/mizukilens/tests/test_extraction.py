@@ -26,6 +26,7 @@ from mizukilens.extraction import (
     extract_timestamps,
     find_candidate_comment,
     find_keyword_comments,
+    get_description_from_ytdlp,
     get_video_info_from_ytdlp,
     is_suspicious_timestamp,
     parse_song_line,
@@ -196,6 +197,31 @@ class TestParseSongLine:
         assert result is not None
         assert result["start_seconds"] == 1425
 
+    def test_hours_group_without_seconds_falls_back_to_mm_ss(self):
+        """"1:23:4" is M:SS followed by ":4", as with the regex."""
+        result = parse_song_line("1:23:4 Song Name")
+        assert result is not None
+        assert result["start_seconds"] == 83
+        assert result["song_name"] == ":4 Song Name"
+
+    def test_fullwidth_digits_use_regex_fallback(self):
+        result = parse_song_line("１:２３ Song Name")
+        assert result is not None
+        assert result["start_seconds"] == 83
+        assert result["song_name"] == "Song Name"
+
+    def test_mixed_ascii_fullwidth_digits_use_regex_fallback(self):
+        result = parse_song_line("1:23:４５ Song")
+        assert result is not None
+        assert result["start_seconds"] == 5025
+        assert result["song_name"] == "Song"
+
+        result = parse_song_line("0:05:０7 Song / Art")
+        assert result is not None
+        assert result["start_seconds"] == 307
+        assert result["song_name"] == "Song"
+        assert result["artist"] == "Art"
+
     def test_dash_separator(self):
         result = parse_song_line("1:23:45 - Song Name")
         assert result is not None
@@ -472,6 +498,14 @@ class TestParseVoteCount:
     def test_m_suffix(self):
         assert _parse_vote_count("2M") == 2_000_000
 
+    def test_fractional_suffix_is_exact(self):
+        assert _parse_vote_count("1.25M") == 1_250_000
+        assert _parse_vote_count("1.005K") == 1005
+
+    def test_non_standard_format_uses_generic_path(self):
+        assert _parse_vote_count(".5K") == 500
+        assert _parse_vote_count("1e3") == 1000
+
     def test_zero(self):
         assert _parse_vote_count("0") == 0
 
@@ -523,6 +557,37 @@ _GOOD_DESCRIPTION_TEXT = (
 )
 
 
+class TestStreamingCommentScan:
+    """Stage 1 consumes the comment generator lazily with early exit."""
+
+    def test_stops_after_qualifying_pinned_comment(self, db):
+        _add_stream(db, "stream01")
+        consumed: list[str] = []
+
+        def _gen():
+            for cid, pinned in (("plain", False), ("pinned", True), ("late", False)):
+                consumed.append(cid)
+                yield _make_comment_dict(_GOOD_COMMENT_TEXT, is_pinned=pinned, cid=cid)
+
+        result = extract_timestamps(db, "stream01", comment_generator=_gen())
+        assert result.comment_id == "pinned"
+        assert consumed == ["plain", "pinned"]
+
+    def test_matches_find_candidate_comment(self):
+        from mizukilens.extraction import _scan_comments
+
+        comments = [
+            _make_comment_dict(_GOOD_COMMENT_TEXT, votes="5", cid="a"),
+            _make_comment_dict("歌單 no timestamps", votes="99", cid="b"),
+            _make_comment_dict(_GOOD_COMMENT_TEXT, votes="1.2K", cid="c"),
+            _make_comment_dict(_GOOD_COMMENT_TEXT, votes="1200", cid="d"),
+        ]
+        best, keyword_comments = _scan_comments(iter(comments), ["歌單"])
+        assert best is find_candidate_comment(comments)
+        assert best["cid"] == "c"
+        assert [c["cid"] for c in keyword_comments] == ["b"]
+
+
 class TestExtractTimestampsFromComment:
     """Tests for comment-stage extraction in :func:`extract_timestamps`."""
 
@@ -1198,6 +1263,11 @@ class TestKeywordCandidates:
         # Both "songlist" and "Songlist" should match (case-insensitive)
         assert len(results[0]["keywords_matched"]) == 2
 
+    def test_find_keyword_comments_no_unicode_case_folding(self):
+        """Matching follows str.lower(), so "ſ" (long s) is not an "s"."""
+        comments = [{"cid": "c1", "text": "ſetlist for today"}]
+        assert find_keyword_comments(comments, keywords=["setlist"]) == []
+
     def test_find_keyword_comments_no_match(self):
         """Comments without keywords should not be matched."""
         comments = [
@@ -1216,6 +1286,13 @@ class TestKeywordCandidates:
         assert len(results) == 1
         assert set(results[0]["keywords_matched"]) == {"歌單", "Songlist"}
 
+    def test_find_keyword_comments_overlapping_keywords(self):
+        """Keywords that are prefixes/substrings of each other all match."""
+        comments = [{"cid": "c1", "text": "Full SETLIST here"}]
+        results = find_keyword_comments(comments, keywords=["set", "setlist", "list", "歌"])
+        assert len(results) == 1
+        assert results[0]["keywords_matched"] == ["set", "setlist", "list"]
+
     def test_candidates_cached_during_extraction(self, db):
         """Integration: extraction saves keyword candidates to DB."""
         from mizukilens.cache import list_candidate_comments
@@ -1469,6 +1546,17 @@ class TestBulletPrefixParseSongLine:
         result = parse_song_line("- Just a comment")
         assert result is None
 
+    def test_tree_number_and_bullet_combined(self):
+        """Tree chars, numbering and bullet are stripped together, in order."""
+        result = parse_song_line("├─ 01. - 0:30 Song Name / Artist")
+        assert result is not None
+        assert result["start_seconds"] == 30
+        assert result["song_name"] == "Song Name"
+
+    def test_bullet_before_number_not_stripped(self):
+        """Numbering is only stripped before a bullet, never after it."""
+        assert parse_song_line("- 1. 0:30 Song Name") is None
+
 
 # ---------------------------------------------------------------------------
 # §  Range timestamp support
@@ -1710,6 +1798,69 @@ class TestExtractFromText:
         assert SAMPLE_TEXT.strip() in (stream["raw_description"] or "")
 
 
+# ---------------------------------------------------------------------------
+# §  get_description_from_ytdlp
+# ---------------------------------------------------------------------------
+
+
+class TestGetDescriptionFromYtdlp:
+    """Tests for :func:`get_description_from_ytdlp`."""
+
+    @patch("mizukilens.extraction._youtube_dl")
+    def test_success(self, mock_ydl):
+        mock_ydl.return_value.extract_info.return_value = {
+            "description": "  0:30 Song A\n1:00 Song B\n",
+        }
+        assert get_description_from_ytdlp("abc123") == "0:30 Song A\n1:00 Song B"
+        mock_ydl.return_value.extract_info.assert_called_once_with(
+            "https://www.youtube.com/watch?v=abc123", download=False, process=False
+        )
+
+    @patch("mizukilens.extraction._youtube_dl")
+    def test_empty_description_returns_none(self, mock_ydl):
+        mock_ydl.return_value.extract_info.return_value = {"description": "  "}
+        assert get_description_from_ytdlp("abc123") is None
+
+    @patch("mizukilens.extraction._youtube_dl")
+    def test_exception_returns_none(self, mock_ydl):
+        mock_ydl.return_value.extract_info.side_effect = RuntimeError("unavailable")
+        assert get_description_from_ytdlp("abc123") is None
+
+    def test_youtube_dl_instance_is_reused(self):
+        import threading
+
+        from mizukilens.extraction import _youtube_dl
+
+        with (
+            patch("mizukilens.extraction._ytdlp_local", threading.local()),
+            patch("yt_dlp.YoutubeDL") as mock_cls,
+        ):
+            assert _youtube_dl() is _youtube_dl()
+        mock_cls.assert_called_once()
+        assert mock_cls.call_args.args[0]["socket_timeout"] == 60
+
+    def test_youtube_dl_instance_per_thread(self):
+        import threading
+
+        from mizukilens.extraction import _youtube_dl
+
+        seen = []
+        with (
+            patch("mizukilens.extraction._ytdlp_local", threading.local()),
+            patch("yt_dlp.YoutubeDL", side_effect=lambda opts: object()),
+        ):
+            threads = [
+                threading.Thread(target=lambda: seen.append(_youtube_dl()))
+                for _ in range(2)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len(seen) == 2
+        assert seen[0] is not seen[1]
+
+
 # ---------------------------------------------------------------------------
 # §  get_video_info_from_ytdlp
 # ---------------------------------------------------------------------------
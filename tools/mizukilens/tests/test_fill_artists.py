@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
+from click.testing import CliRunner
 
+from mizukilens.cli import main
 from mizukilens.fill_artists import (
     FillCandidate,
     apply_fill_plan,
@@ -41,6 +45,13 @@ class TestNormalizeTitleForMatching:
     def test_mixed_cjk_and_latin(self):
         assert normalize_title_for_matching("  aLIEz  ") == "aliez"
 
+    def test_memoized(self):
+        normalize_title_for_matching.cache_clear()
+        normalize_title_for_matching("Idol")
+        normalize_title_for_matching("Idol")
+        info = normalize_title_for_matching.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 # ===========================================================================
 # compute_fill_plan
@@ -195,3 +206,37 @@ class TestApplyFillPlan:
     def test_empty_candidates(self):
         songs = [_song("s1", "a")]
         assert apply_fill_plan(songs, []) == 0
+
+    def test_song_by_id_index(self):
+        songs = [_song("s1", "a"), _song("s2", "b"), _song("s3", "c")]
+        song_by_id = {s["id"]: s for s in songs}
+        candidates = [
+            FillCandidate("s2", "b", "unique", {"Y": 1}, "Y"),
+            FillCandidate("s3", "c", "no_match", {}, None),
+            FillCandidate("missing", "d", "unique", {"Z": 1}, "Z"),
+        ]
+        assert apply_fill_plan(songs, candidates, song_by_id) == 1
+        assert songs[1]["originalArtist"] == "Y"
+        assert songs[0]["originalArtist"] == ""
+
+
+# ===========================================================================
+# fill-artists CLI
+# ===========================================================================
+
+class TestFillArtistsCommand:
+    def test_passes_id_index_to_apply(self, tmp_path, monkeypatch):
+        data = tmp_path / "data"
+        data.mkdir()
+        songs = [_song("s1", "aLIEz", "澤野弘之"), _song("s2", "aLIEz")]
+        (data / "songs.json").write_text(json.dumps(songs), encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        with patch("mizukilens.fill_artists.apply_fill_plan", wraps=apply_fill_plan) as spy:
+            result = CliRunner().invoke(main, ["fill-artists", "-y"])
+
+        assert result.exit_code == 0, result.output
+        song_by_id = spy.call_args.args[2]
+        assert set(song_by_id) == {"s1", "s2"}
+        written = json.loads((data / "songs.json").read_text(encoding="utf-8"))
+        assert written[1]["originalArtist"] == "澤野弘之"
@@ -7,6 +7,7 @@ All file I/O uses tmp_path.
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 from copy import deepcopy
 from pathlib import Path
@@ -264,6 +265,40 @@ class TestValidateExportJson:
         with pytest.raises(ValueError, match="startTimestamp"):
             validate_export_json(payload)
 
+    def test_reports_all_problems_at_once(self) -> None:
+        payload = {
+            "source": "mizukilens",
+            "data": {"streams": [{"id": "vid001"}], "songs": {}, "versions": []},
+        }
+        with pytest.raises(ValueError) as exc_info:
+            validate_export_json(payload)
+        message = str(exc_info.value)
+        assert "Missing top-level key: 'version'" in message
+        assert "'data.songs' must be an array" in message
+        assert "data.streams[0] missing required field 'title'" in message
+
+    def test_bad_comment_credit_raises(self) -> None:
+        payload = _make_export_payload(
+            streams=[{"id": "vid001", "title": "Test", "date": "2024-01-01",
+                      "commentCredit": {"authorUrl": "https://x"}}],
+        )
+        with pytest.raises(ValueError, match="commentCredit.author"):
+            validate_export_json(payload)
+
+    def test_non_string_artist_raises(self) -> None:
+        payload = _make_export_payload(
+            songs=[{"id": "mlens-song-001", "name": "Song A", "artist": None}],
+        )
+        with pytest.raises(ValueError, match="artist must be a string"):
+            validate_export_json(payload)
+
+    def test_valid_comment_credit_accepted(self) -> None:
+        payload = _make_export_payload(
+            streams=[{"id": "vid001", "title": "Test", "date": "2024-01-01",
+                      "commentCredit": {"author": "Alice"}}],
+        )
+        validate_export_json(payload)  # must not raise
+
 
 # ===========================================================================
 # SECTION 3: ID generation
@@ -483,6 +518,26 @@ class TestSongMatching:
         updated = plan.updated_songs[0]
         assert updated["title"] == "First Love"
 
+    def test_caller_songs_not_mutated(self) -> None:
+        """Adding performances must not touch the caller's song data."""
+        existing_songs = deepcopy(_EXISTING_SONGS)
+        snapshot = deepcopy(existing_songs)
+
+        payload = _make_export_payload(
+            streams=[{"id": "vid_new", "title": "New Stream", "date": "2024-06-01"}],
+            songs=[{"id": "mlens-song-abc", "name": "First Love", "artist": "宇多田光", "tags": []}],
+            versions=[{
+                "id": "mlens-ver-001",
+                "songId": "mlens-song-abc",
+                "streamId": "vid_new",
+                "startTimestamp": "0:05:00",
+            }],
+        )
+        plan = compute_import_plan(payload, existing_songs, deepcopy(_EXISTING_STREAMS))
+
+        assert len(plan._merged_songs[0]["performances"]) == 2
+        assert existing_songs == snapshot
+
     def test_existing_song_not_duplicated(self) -> None:
         existing_songs = deepcopy(_EXISTING_SONGS)
         existing_streams = deepcopy(_EXISTING_STREAMS)
@@ -779,6 +834,69 @@ class TestBackupCreation:
         bak_songs = json.loads(songs_path.with_suffix(".json.bak").read_text(encoding="utf-8"))
         assert len(bak_songs) == len(_EXISTING_SONGS)
 
+    def test_backup_replaced_on_next_import(self, tmp_path: Path) -> None:
+        """A second import backs up the first import's output; no temp files remain."""
+        songs_path = tmp_path / "songs.json"
+        streams_path = tmp_path / "streams.json"
+        _write_json(songs_path, _EXISTING_SONGS)
+        _write_json(streams_path, _EXISTING_STREAMS)
+
+        for vid, date in (("vid_a", "2024-01-01"), ("vid_b", "2024-02-01")):
+            payload = _make_export_payload(streams=[{"id": vid, "title": vid, "date": date}])
+            songs, streams = load_mizukiprism_data(songs_path, streams_path)
+            execute_import(compute_import_plan(payload, songs, streams), songs_path, streams_path)
+
+        bak_streams = json.loads(streams_path.with_suffix(".json.bak").read_text(encoding="utf-8"))
+        written = json.loads(streams_path.read_text(encoding="utf-8"))
+        assert len(bak_streams) == len(_EXISTING_STREAMS) + 1
+        assert len(written) == len(_EXISTING_STREAMS) + 2
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_backup_falls_back_to_copy_without_links(self, tmp_path: Path) -> None:
+        songs_path = tmp_path / "songs.json"
+        streams_path = tmp_path / "streams.json"
+        _write_json(songs_path, _EXISTING_SONGS)
+        _write_json(streams_path, _EXISTING_STREAMS)
+
+        payload = _make_export_payload(
+            streams=[{"id": "new_vid", "title": "New", "date": "2024-01-01"}],
+        )
+        plan = compute_import_plan(payload, deepcopy(_EXISTING_SONGS), deepcopy(_EXISTING_STREAMS))
+        with patch("mizukilens.importer.os.link", side_effect=OSError("EXDEV")):
+            execute_import(plan, songs_path, streams_path)
+
+        bak_streams = json.loads(streams_path.with_suffix(".json.bak").read_text(encoding="utf-8"))
+        assert bak_streams == _EXISTING_STREAMS
+
+    def test_failed_write_leaves_both_files_untouched(self, tmp_path: Path) -> None:
+        songs_path = tmp_path / "songs.json"
+        streams_path = tmp_path / "streams.json"
+        _write_json(songs_path, _EXISTING_SONGS)
+        _write_json(streams_path, _EXISTING_STREAMS)
+        original_songs = songs_path.read_bytes()
+        original_streams = streams_path.read_bytes()
+
+        payload = _make_export_payload(
+            streams=[{"id": "new_vid", "title": "New", "date": "2024-01-01"}],
+        )
+        plan = compute_import_plan(payload, deepcopy(_EXISTING_SONGS), deepcopy(_EXISTING_STREAMS))
+        real_fsync = os.fsync
+        calls: list[int] = []
+
+        def flaky_fsync(fd: int) -> None:
+            calls.append(fd)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_fsync(fd)
+
+        with patch("mizukilens.importer.os.fsync", side_effect=flaky_fsync):
+            with pytest.raises(OSError, match="disk full"):
+                execute_import(plan, songs_path, streams_path)
+
+        assert songs_path.read_bytes() == original_songs
+        assert streams_path.read_bytes() == original_streams
+        assert not list(tmp_path.glob("*.tmp"))
+
 
 # ===========================================================================
 # SECTION 10: Output files remain valid JSON
@@ -787,6 +905,55 @@ class TestBackupCreation:
 class TestOutputFilesValidJson:
     """Output files must remain valid JSON with correct structure after import."""
 
+    def test_new_song_without_tags_written_as_empty_array(self, tmp_path: Path) -> None:
+        songs_path = tmp_path / "songs.json"
+        streams_path = tmp_path / "streams.json"
+        _write_json(songs_path, [])
+        _write_json(streams_path, [])
+
+        payload = _make_export_payload(
+            streams=[{"id": "new_vid", "title": "New", "date": "2024-06-01"}],
+            songs=[{"id": "mlens-song-abc", "name": "Untagged", "artist": "A"}],
+            versions=[{
+                "id": "mlens-ver-001",
+                "songId": "mlens-song-abc",
+                "streamId": "new_vid",
+                "startTimestamp": "0:01:00",
+            }],
+        )
+        plan = compute_import_plan(payload, [], [])
+        # In-memory song dicts use a list like every other song
+        assert plan.new_songs[0]["tags"] == []
+        execute_import(plan, songs_path, streams_path)
+
+        songs = json.loads(songs_path.read_text(encoding="utf-8"))
+        assert songs[0]["tags"] == []
+
+    def test_output_layout_matches_indented_json(self, tmp_path: Path) -> None:
+        """Files keep the json.dump(indent=2, ensure_ascii=False) layout + newline."""
+        songs_path = tmp_path / "songs.json"
+        streams_path = tmp_path / "streams.json"
+        _write_json(songs_path, deepcopy(_EXISTING_SONGS))
+        _write_json(streams_path, deepcopy(_EXISTING_STREAMS))
+
+        payload = _make_export_payload(
+            streams=[{"id": "new_vid", "title": "新歌回", "date": "2024-06-01"}],
+            songs=[{"id": "mlens-song-abc", "name": "紅蓮華", "artist": "LiSA", "tags": []}],
+            versions=[{
+                "id": "mlens-ver-001",
+                "songId": "mlens-song-abc",
+                "streamId": "new_vid",
+                "startTimestamp": "0:01:00",
+            }],
+        )
+        plan = compute_import_plan(payload, deepcopy(_EXISTING_SONGS), deepcopy(_EXISTING_STREAMS))
+        execute_import(plan, songs_path, streams_path)
+
+        for path in (songs_path, streams_path):
+            text = path.read_text(encoding="utf-8")
+            expected = json.dumps(json.loads(text), ensure_ascii=False, indent=2) + "\n"
+            assert text == expected
+
     def test_songs_json_valid_after_import(self, tmp_path: Path) -> None:
         songs_path = tmp_path / "songs.json"
         streams_path = tmp_path / "streams.json"
@@ -1167,6 +1334,38 @@ class TestFullImportRoundTrip:
         assert result.new_stream_count == 0
         assert result.new_version_count == 0
 
+    def test_overwrite_conflict_leaves_plan_untouched(self, tmp_path: Path) -> None:
+        """Overwriting a conflict writes the performance without mutating the plan."""
+        songs_path = tmp_path / "songs.json"
+        streams_path = tmp_path / "streams.json"
+        _write_json(songs_path, deepcopy(_EXISTING_SONGS))
+        _write_json(streams_path, deepcopy(_EXISTING_STREAMS))
+
+        payload = _make_export_payload(
+            streams=[{"id": "_Q5-4yMi-xg", "title": "秋日歌回", "date": "2023-10-15"}],
+            songs=[{"id": "mlens-song-abc", "name": "Idol", "artist": "YOASOBI", "tags": []}],
+            versions=[{
+                "id": "mlens-ver-001",
+                "songId": "mlens-song-abc",
+                "streamId": "_Q5-4yMi-xg",
+                "startTimestamp": "0:10:00",
+            }],
+        )
+        plan = compute_import_plan(payload, deepcopy(_EXISTING_SONGS), deepcopy(_EXISTING_STREAMS))
+        snapshot = deepcopy(plan._merged_songs)
+
+        result = execute_import(
+            plan, songs_path, streams_path,
+            overwrite_video_ids={"_Q5-4yMi-xg"}, payload=payload,
+        )
+
+        assert result.overwritten_count == 1
+        assert plan._merged_songs == snapshot
+        written = json.loads(songs_path.read_text(encoding="utf-8"))
+        idol = next(s for s in written if s["id"] == "song-2")
+        assert [p["timestamp"] for p in idol["performances"]] == [500, 600]
+        assert idol["performances"][1]["streamId"] == "stream-2023-10-15"
+
 
 # ===========================================================================
 # SECTION 14: CLI import command
@@ -8,6 +8,7 @@ Coverage:
   - upsert_song_metadata()  — insert, update
   - upsert_artist_info()    — insert, update
   - is_stale()              — fresh, stale, missing
+  - plan_fetches()          — --missing / --stale / --all selection
   - fetch_song_metadata()   — full integration (mocked APIs), all branches
   - get_metadata_status()   — cross-reference logic, pending/matched/no_match
   - CLI: metadata fetch     — --missing, --stale, --all, --song, --force,
@@ -24,6 +25,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
+import httpx
 import pytest
 from click.testing import CliRunner
 
@@ -31,14 +33,17 @@ from mizukilens.cli import main
 from mizukilens.metadata import (
     STALE_DAYS,
     FetchResult,
+    RecordStore,
     SongStatusRecord,
     _clean_title,
     _strip_featuring,
     fetch_itunes_metadata,
     fetch_song_metadata,
+    fetch_song_metadata_into,
     get_metadata_status,
     is_stale,
     normalize_artist,
+    plan_fetches,
     read_metadata_file,
     upsert_artist_info,
     upsert_song_metadata,
@@ -102,6 +107,17 @@ class TestNormalizeArtist:
     def test_already_normalized(self):
         assert normalize_artist("yoasobi") == "yoasobi"
 
+    def test_fullwidth_folded(self):
+        assert normalize_artist("ＹＯＡＳＯＢＩ") == "yoasobi"
+
+    def test_ideographic_space_collapsed(self):
+        assert normalize_artist("宇多田\u3000\u3000光") == "宇多田 光"
+
+    def test_memoized(self):
+        normalize_artist.cache_clear()
+        assert normalize_artist("  Ado ") == normalize_artist("  Ado ") == "ado"
+        assert normalize_artist.cache_info().hits == 1
+
 
 # ---------------------------------------------------------------------------
 # fetch_itunes_metadata — mocked _itunes_search
@@ -284,6 +300,19 @@ class TestItunesConditionalStrategies:
         # Strategy 2: cleaned artist + title
         assert queries[1] == "きくお テスト曲"
 
+    def test_duplicate_queries_skipped(self):
+        """An empty artist makes strategy 1 equal to the title-only query: ask once."""
+        queries: list[str] = []
+        def side_effect(query):
+            queries.append(query)
+            return []
+
+        with patch("mizukilens.metadata._itunes_search", side_effect=side_effect):
+            result = fetch_itunes_metadata("", "Idol")
+
+        assert result["match_confidence"] is None
+        assert queries == ["Idol"]
+
     def test_special_punct_title_adds_cleaned_strategy(self):
         """Title with CJK punctuation triggers cleaned title strategy."""
         queries: list[str] = []
@@ -402,6 +431,29 @@ class TestWriteMetadataFile:
         text = p.read_text(encoding="utf-8")
         assert text.endswith("\n")
 
+    def test_fsyncs_before_rename(self, tmp_path):
+        import mizukilens.metadata as m_module
+
+        p = tmp_path / "out.json"
+        events: list[str] = []
+        real_fsync = m_module.os.fsync
+
+        def recording_fsync(fd):
+            events.append("fsync" if not p.exists() else "fsync-after-rename")
+            real_fsync(fd)
+
+        with patch.object(m_module.os, "fsync", side_effect=recording_fsync):
+            write_metadata_file(p, [])
+        assert events == ["fsync"]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_layout_matches_indented_json(self, tmp_path):
+        """Output is byte-identical to json.dump(indent=2, ensure_ascii=False) + newline."""
+        p = tmp_path / "out.json"
+        data = [{"songId": "song-1", "albumArtUrls": None, "originalName": "宇多田光", "trackDuration": 240}]
+        write_metadata_file(p, data)
+        assert p.read_text(encoding="utf-8") == json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+
 
 # ---------------------------------------------------------------------------
 # upsert_song_metadata
@@ -463,6 +515,25 @@ class TestUpsertArtistInfo:
         assert len(result) == 2
 
 
+class TestRecordStore:
+    def test_upsert_matches_list_helper(self):
+        records = [
+            {"songId": "song-1", "v": 1},
+            {"note": "no key"},
+            {"songId": "song-2", "v": 1},
+        ]
+        store = RecordStore.from_records(records, "songId")
+        entry = {"songId": "song-1", "v": 2}
+        store.upsert(entry)
+        store.upsert({"songId": "song-3", "v": 1})
+
+        expected = upsert_song_metadata(records, entry)
+        expected = upsert_song_metadata(expected, {"songId": "song-3", "v": 1})
+        assert store.records() == expected
+        assert store.get("song-1") == entry
+        assert store.get("missing") is None
+
+
 # ---------------------------------------------------------------------------
 # is_stale
 # ---------------------------------------------------------------------------
@@ -485,6 +556,11 @@ class TestIsStale:
     def test_invalid_date_is_stale(self):
         assert is_stale({"fetchedAt": "not-a-date"}) is True
 
+    def test_explicit_now(self):
+        entry = {"fetchedAt": "2026-01-01T00:00:00"}
+        assert is_stale(entry, now=datetime(2026, 3, 1, tzinfo=timezone.utc)) is False
+        assert is_stale(entry, now=datetime(2026, 4, 1, tzinfo=timezone.utc)) is True
+
     def test_exactly_stale_threshold(self):
         """Entry fetchedAt exactly STALE_DAYS days ago should be stale."""
         exact = (datetime.now(tz=timezone.utc) - timedelta(days=STALE_DAYS)).isoformat()
@@ -492,6 +568,38 @@ class TestIsStale:
         assert is_stale(entry) is True
 
 
+# ---------------------------------------------------------------------------
+# plan_fetches
+# ---------------------------------------------------------------------------
+
+class TestPlanFetches:
+    SONGS = [{"id": "song-1"}, {"id": "song-2"}, {"id": "song-3"}, {"id": "song-4"}]
+    BY_ID = {
+        "song-1": {"songId": "song-1", "fetchStatus": "matched", "fetchedAt": _fresh_iso()},
+        "song-2": {"songId": "song-2", "fetchStatus": "no_match", "fetchedAt": _stale_iso()},
+        "song-3": {"songId": "song-3", "fetchStatus": "manual", "fetchedAt": _fresh_iso()},
+    }
+
+    def _ids(self, songs):
+        return [s["id"] for s in songs]
+
+    def test_missing(self):
+        assert self._ids(plan_fetches(self.SONGS, self.BY_ID, "missing")) == ["song-4"]
+
+    def test_stale(self):
+        assert self._ids(plan_fetches(self.SONGS, self.BY_ID, "stale")) == ["song-2"]
+
+    def test_all_skips_manual(self):
+        assert self._ids(plan_fetches(self.SONGS, self.BY_ID, "all")) == [
+            "song-1", "song-2", "song-4",
+        ]
+
+    def test_all_force(self):
+        assert self._ids(plan_fetches(self.SONGS, self.BY_ID, "all", force=True)) == [
+            "song-1", "song-2", "song-3", "song-4",
+        ]
+
+
 # ---------------------------------------------------------------------------
 # fetch_song_metadata — integration (mocked APIs, real file I/O)
 # ---------------------------------------------------------------------------
@@ -583,6 +691,17 @@ class TestFetchSongMetadata:
         assert result.art_status == "matched"
         assert metadata_dir.exists()
 
+    def test_fetch_into_updates_records_without_writing(self, metadata_dir, song):
+        metadata = RecordStore.from_records([], "songId")
+        artists = RecordStore.from_records([], "normalizedArtist")
+        with patch("mizukilens.metadata._itunes_search", return_value=[make_itunes_track()]):
+            result = fetch_song_metadata_into(song, metadata, artists)
+
+        assert result.art_status == "matched"
+        assert [r["songId"] for r in metadata.records()] == ["song-1"]
+        assert [r["normalizedArtist"] for r in artists.records()] == ["test artist"]
+        assert json.loads((metadata_dir / "song-metadata.json").read_text()) == []
+
     def test_album_art_url_set_to_xl(self, metadata_dir, song):
         """albumArtUrl is set to the XL URL."""
         track = make_itunes_track()
@@ -646,6 +765,111 @@ class TestRateLimiting:
         assert sleep_calls[0] > 0
         assert sleep_calls[0] <= m_module._ITUNES_MIN_INTERVAL_SEC + 0.01
 
+    def test_concurrent_callers_get_distinct_slots(self):
+        """Threads calling _wait_itunes at once are spaced a full interval apart."""
+        import threading
+        import mizukilens.metadata as m_module
+
+        m_module._last_itunes_call = time.monotonic() - 100
+        sleeps: list[float] = []
+
+        with patch("mizukilens.metadata.time.sleep", side_effect=sleeps.append):
+            threads = [threading.Thread(target=m_module._wait_itunes) for _ in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        m_module._last_itunes_call = 0.0  # don't leave the next slot in the future
+
+        interval = m_module._ITUNES_MIN_INTERVAL_SEC
+        assert sorted(round(s / interval) for s in sleeps) == [1, 2]
+
+
+# ---------------------------------------------------------------------------
+# HTTP helper — _http_get_json
+# ---------------------------------------------------------------------------
+
+class TestHttpGetJson:
+    """_http_get_json over the shared client, with a mocked transport."""
+
+    def _client(self, handler) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_parses_json(self):
+        import mizukilens.metadata as m_module
+
+        client = self._client(lambda req: httpx.Response(200, json={"results": [1]}))
+        with patch.object(m_module, "_http_client", return_value=client):
+            assert m_module._http_get_json("https://example.com/a") == {"results": [1]}
+
+    def test_invalid_json(self):
+        import mizukilens.metadata as m_module
+
+        client = self._client(lambda req: httpx.Response(200, content=b"<html>"))
+        with patch.object(m_module, "_http_client", return_value=client):
+            with pytest.raises(json.JSONDecodeError):
+                m_module._http_get_json("https://example.com/a")
+
+    def test_itunes_search_requests_top_hit_only(self):
+        import mizukilens.metadata as m_module
+
+        with (
+            patch.object(m_module, "_wait_itunes"),
+            patch.object(m_module, "_http_get_json", return_value={"results": []}) as get,
+        ):
+            m_module._itunes_search("YOASOBI Idol")
+        assert "limit=1&" in get.call_args.args[0] or get.call_args.args[0].endswith("limit=1")
+
+    def test_itunes_search_url_matches_urlencode(self):
+        import urllib.parse
+        import mizukilens.metadata as m_module
+
+        query = "きくお feat. 初音ミク & Co/100%"
+        with (
+            patch.object(m_module, "_wait_itunes"),
+            patch.object(m_module, "_http_get_json", return_value={"results": []}) as get,
+        ):
+            m_module._itunes_search(query, country="US")
+        expected = urllib.parse.urlencode({
+            "term": query, "media": "music", "entity": "song",
+            "country": "US", "limit": "1",
+        })
+        assert get.call_args.args[0] == f"{m_module.ITUNES_SEARCH_URL}?{expected}"
+
+    def test_client_is_shared(self):
+        import mizukilens.metadata as m_module
+
+        assert m_module._http_client() is m_module._http_client()
+
+    def test_http_error_status(self):
+        import mizukilens.metadata as m_module
+
+        client = self._client(lambda req: httpx.Response(503))
+        with patch.object(m_module, "_http_client", return_value=client):
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                m_module._http_get_json("https://example.com/a")
+        assert exc_info.value.code == 503
+
+    def test_timeout_mapped(self):
+        import mizukilens.metadata as m_module
+
+        def handler(req):
+            raise httpx.ReadTimeout("slow", request=req)
+
+        with patch.object(m_module, "_http_client", return_value=self._client(handler)):
+            with pytest.raises(TimeoutError):
+                m_module._http_get_json("https://example.com/a")
+
+    def test_network_error_mapped(self):
+        import mizukilens.metadata as m_module
+
+        def handler(req):
+            raise httpx.ConnectError("refused", request=req)
+
+        with patch.object(m_module, "_http_client", return_value=self._client(handler)):
+            with pytest.raises(urllib.error.URLError):
+                m_module._http_get_json("https://example.com/a")
+
 
 # ---------------------------------------------------------------------------
 # CLI: metadata fetch
@@ -864,6 +1088,27 @@ class TestCLIMetadataFetch:
         assert result.exit_code == 0
         assert "Nothing to do" in result.output or "No songs" in result.output
 
+    def test_files_written_once_per_batch(self, prism_root):
+        """Records are written back at checkpoints and at the end, not per song."""
+        import mizukilens.metadata as m_module
+
+        track = make_itunes_track()
+        with (
+            patch("mizukilens.metadata._itunes_search", return_value=[track]),
+            patch.object(
+                m_module, "write_metadata_file", wraps=m_module.write_metadata_file,
+            ) as write_spy,
+        ):
+            result = self._run(["metadata", "fetch", "--missing"], prism_root)
+
+        assert result.exit_code == 0
+        # One final write of song-metadata.json + artist-info.json for 2 songs
+        assert write_spy.call_count == 2
+        metadata = json.loads(
+            (prism_root / "data" / "metadata" / "song-metadata.json").read_text()
+        )
+        assert [m["songId"] for m in metadata] == ["song-1", "song-2"]
+
     def test_fetched_at_is_set(self, prism_root):
         """Each fetched entry has a fetchedAt timestamp."""
         track = make_itunes_track()
@@ -984,6 +1229,11 @@ class TestGetMetadataStatus:
         assert len(records) == 2
         assert all(r.cover_status == "pending" for r in records)
 
+    def test_corrupt_songs_json_yields_no_records(self, tmp_path):
+        data_dir, metadata_dir = self._make_root(tmp_path, [])
+        (data_dir / "songs.json").write_bytes(b"[{\"id\": \xff")
+        assert get_metadata_status(data_dir / "songs.json", metadata_dir) == []
+
     def test_matched_song_shows_correct_status(self, tmp_path):
         songs = [{"id": "s1", "title": "First Love", "originalArtist": "宇多田光"}]
         metadata = [{
@@ -1273,6 +1523,19 @@ class TestCLIMetadataStatus:
         assert "error: 1" in result.output
         assert "pending: 1" in result.output
 
+    def test_filtered_summary_reads_files_once(self, prism_root):
+        """The summary reuses the status records instead of re-reading the files."""
+        import mizukilens.metadata as m_module
+
+        with patch.object(
+            m_module, "get_metadata_status", wraps=m_module.get_metadata_status,
+        ) as status_spy:
+            result = self._run(["metadata", "status", "--filter", "matched"], prism_root)
+
+        assert result.exit_code == 0
+        assert "Total: 4" in result.output
+        assert status_spy.call_count == 1
+
     def test_empty_songs_json(self, tmp_path):
         """When songs.json is empty, output indicates no songs."""
         data_dir = tmp_path / "data"
@@ -21,8 +21,10 @@ from mizukilens.cache import (
 )
 from mizukilens.cli import main
 from mizukilens.review_ops import (
+    _NOISE_RE,
     _clean_artist_field,
     _has_emoji_artifacts,
+    _may_have_noise,
     batch_approve,
     batch_exclude,
     categorize_stream,
@@ -137,6 +139,17 @@ class TestEmojiArtifacts:
     def test_has_emoji_artifacts(self, artist: str, expected: bool) -> None:
         assert _has_emoji_artifacts(artist) == expected
 
+    @pytest.mark.parametrize("text", [
+        "✰□", "♡⃛", "🍮", ":_Emote:", "01. Song", "１. Song",
+    ])
+    def test_prefilter_passes_noise(self, text: str) -> None:
+        assert _may_have_noise(text)
+        assert _NOISE_RE.search(text) is not None
+
+    @pytest.mark.parametrize("text", ["Normal Artist Name", "DAOKO×米津玄師", "", "Song 1."])
+    def test_prefilter_rejects_clean_text(self, text: str) -> None:
+        assert not _may_have_noise(text)
+
     @pytest.mark.parametrize("artist,expected", [
         ("✰:_MIZUKIMilk: Aimer", "Aimer"),
         ("✩:_Custom: ✰□ Artist", "Artist"),
@@ -150,6 +163,7 @@ class TestEmojiArtifacts:
         ("🍮:_MIZUKIMilk: title", "title"),
         ("✿:_MIZUKIMilk: artist", "artist"),
         ("artist ✩:_MIZUKIMilk:", "artist"),
+        ("★★:_Milk Tea: artist", "artist"),      # star run before a spaced emote
         # Numbered setlist prefix cleaning
         ("01. DROP", "DROP"),
         ("12. 絕頂讚歌", "絕頂讚歌"),
@@ -187,6 +201,24 @@ class TestGenerateReport:
 
         generate_report(db, detail=True)
 
+    def test_report_counts(self, db: sqlite3.Connection, capsys: pytest.CaptureFixture[str]) -> None:
+        _add_stream(db, "vid1", "歌枠 Vol.1")
+        _add_songs(db, "vid1", [
+            _make_song(1, artist="Singer A"),
+            _make_song(2, artist="✰:_MIZUKIMilk: Singer B"),
+            _make_song(3),
+        ])
+        _add_stream(db, "vid2", "Game 配信")
+
+        with patch("mizukilens.review_ops.get_parsed_songs") as per_stream:
+            generate_report(db, detail=True)
+        per_stream.assert_not_called()
+
+        out = capsys.readouterr().out
+        assert "歌曲含原唱者: 2/3 (67%)" in out
+        assert "emoji 雜訊: 1 songs" in out
+        assert "2/3" in out and "—" in out
+
     def test_report_no_extracted(self, db: sqlite3.Connection) -> None:
         _add_stream(db, "vid1", "Test", status="discovered")
         generate_report(db)  # Should handle gracefully
@@ -436,6 +468,29 @@ class TestCleanParsedSongs:
         assert songs[0]["end_timestamp"] == "0:10:00"
         assert songs[0]["note"] == "acoustic ver."
 
+    def test_clean_keeps_manual_stamps_and_clean_rows(self, db: sqlite3.Connection) -> None:
+        _add_stream(db, "vid1", "歌枠")
+        _add_songs(db, "vid1", [
+            _make_song(1, artist="✰:_MIZUKIMilk: Aimer"),
+            _make_song(2, artist="Clean"),
+        ])
+        dirty, clean = get_parsed_songs(db, "vid1")
+        db.execute(
+            "UPDATE parsed_songs SET end_timestamp = '0:05:00', manual_end_ts = 1, "
+            "duration = 240 WHERE id = ?",
+            (dirty["id"],),
+        )
+        db.commit()
+
+        assert clean_parsed_songs(db) == 1
+
+        songs = get_parsed_songs(db, "vid1")
+        assert [s["id"] for s in songs] == [dirty["id"], clean["id"]]
+        assert songs[0]["artist"] == "Aimer"
+        assert songs[0]["end_timestamp"] == "0:05:00"
+        assert songs[0]["manual_end_ts"] == 1
+        assert songs[0]["duration"] == 240
+
     def test_clean_null_artist_ignored(self, db: sqlite3.Connection) -> None:
         _add_stream(db, "vid1", "歌枠")
         _add_songs(db, "vid1", [
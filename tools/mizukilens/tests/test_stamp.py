@@ -595,6 +595,54 @@ class TestApiStats:
         assert data["filled"] == 2
         assert data["remaining"] == 1
 
+    def test_stats_cached_until_write(self, client, db_path: Path) -> None:
+        assert client.get("/api/stats").get_json()["filled"] == 1
+        # Out-of-band change: hidden until the TTL expires or the app writes.
+        conn = open_db(db_path)
+        conn.execute("UPDATE parsed_songs SET end_timestamp = '1:00' WHERE order_index = 0")
+        conn.commit()
+        conn.close()
+        assert client.get("/api/stats").get_json()["filled"] == 1
+
+        client.delete("/api/songs/999/end-timestamp")  # any write invalidates
+        assert client.get("/api/stats").get_json()["filled"] == 2
+
+    def test_read_overlapping_a_write_is_not_cached(self, client, db_path: Path) -> None:
+        """A result computed while a write lands must not outlive that write."""
+        import threading
+
+        def write_during_read(*args, **kwargs):
+            conn = open_db(*args, **kwargs)
+            if not write_during_read.done:
+                write_during_read.done = True
+                writer = threading.Thread(
+                    target=lambda: client.application.test_client().delete(
+                        "/api/songs/999/end-timestamp"
+                    )
+                )
+                writer.start()
+                writer.join()
+            return conn
+
+        write_during_read.done = False
+        with patch("mizukilens.cache.open_db", side_effect=write_during_read):
+            assert client.get("/api/stats").get_json()["filled"] == 1
+
+        conn = open_db(db_path)
+        conn.execute("UPDATE parsed_songs SET end_timestamp = '1:00' WHERE order_index = 0")
+        conn.commit()
+        conn.close()
+        assert client.get("/api/stats").get_json()["filled"] == 2
+
+    def test_stats_cache_expires(self, client, db_path: Path) -> None:
+        client.get("/api/stats")
+        conn = open_db(db_path)
+        conn.execute("UPDATE parsed_songs SET end_timestamp = '1:00' WHERE order_index = 0")
+        conn.commit()
+        conn.close()
+        with patch("mizukilens.stamp.time.monotonic", return_value=1e12):
+            assert client.get("/api/stats").get_json()["filled"] == 2
+
 
 # ===========================================================================
 # SECTION 10: Flask API — stamp re-approves stream
@@ -1402,3 +1450,27 @@ class TestApiRefetchStream:
         assert data["source"] is None
         assert data["songCount"] == 0
         assert data["status"] == "pending"
+
+
+# ===========================================================================
+# SECTION 22: Flask API — connection reuse
+# ===========================================================================
+
+class TestConnectionReuse:
+    def test_connection_reused_across_requests(self, client) -> None:
+        # An uncached route, so every request goes through _open().
+        with patch("mizukilens.cache.open_db", wraps=open_db) as opener:
+            for _ in range(3):
+                assert client.get("/api/streams/abc123/songs").status_code == 200
+        assert opener.call_count == 1
+
+    def test_writes_visible_to_other_connections(self, client, db_path: Path) -> None:
+        client.get("/api/streams/abc123/songs")  # park a pooled connection
+        resp = client.put("/api/songs/1/end-timestamp", json={"endTimestamp": "5:00"})
+        assert resp.status_code == 200
+        conn = open_db(db_path)
+        try:
+            row = conn.execute("SELECT end_timestamp FROM parsed_songs WHERE id = 1").fetchone()
+            assert row["end_timestamp"] == "5:00"
+        finally:
+            conn.close()